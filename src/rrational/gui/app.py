@@ -192,13 +192,19 @@ def get_plot_colors():
     }
 
 
-# Page configuration - load favicon
-_favicon_path = Path(__file__).parent / "assets" / "favicon.svg"
-_favicon = _favicon_path.read_text() if _favicon_path.exists() else "R"
+@st.cache_resource(show_spinner=False)
+def _load_favicon() -> str:
+    """Read the packaged favicon once per server process, not on every rerun."""
+    from importlib import resources
+
+    asset = resources.files("rrational.gui").joinpath("assets", "favicon.svg")
+    return asset.read_text(encoding="utf-8") if asset.is_file() else "R"
+
 
+# Page configuration - load favicon
 st.set_page_config(
     page_title="RRational" + (" [TEST MODE]" if TEST_MODE else ""),
-    page_icon=_favicon,
+    page_icon=_load_favicon(),
     layout="wide",
 )
 
@@ -1838,7 +1844,7 @@ if not st.session_state.summaries:
     auto_load_enabled = st.session_state.app_settings.get("auto_load", False)
     should_auto_load = (TEST_MODE or auto_load_enabled) and st.session_state.data_dir
     if should_auto_load:
-        from rrational.gui.shared import cached_load_hrv_logger_preview, cached_load_vns_preview
+        from rrational.gui.shared import cached_load_hrv_logger_preview, cached_load_vns_preview, normalize_summaries
         from rrational.gui.tabs.data import RECORDING_APP_DETECTION
 
         config_dict = {"rr_min_ms": 200, "rr_max_ms": 2000, "sudden_change_pct": 100}
@@ -1884,6 +1890,7 @@ if not st.session_state.summaries:
                         gui_events_dict=gui_events_dict,
                         use_corrected=st.session_state.get("vns_use_corrected", False),
                     )
+                normalize_summaries(folder_summaries, "VNS Analyse" if format_type == "vns" else "HRV Logger")
                 # Only add summaries that aren't already loaded (by participant_id)
                 existing_ids = {s.participant_id for s in summaries}
                 for s in folder_summaries:
@@ -7445,6 +7452,10 @@ def _load_project(project_path: Path | str | None) -> None:
         project_path: Path to project directory, or None for temporary workspace
     """
     from rrational.gui.persistence import save_last_project
+    from rrational.gui.shared import flush_config
+
+    # Write any pending edits to the project they were made in
+    flush_config()
 
     if project_path is None or project_path == "":
         # Temporary workspace mode - use global config
@@ -7564,6 +7575,8 @@ def main():
                 st.button(page_id, key=f"nav_{page_id}", width='stretch', type="primary")
             else:
                 if st.button(page_id, key=f"nav_{page_id}", width='stretch', type="secondary"):
+                    from rrational.gui.shared import flush_config
+                    flush_config()
                     st.session_state.active_page = page_id
                     st.session_state._scroll_to_top = True  # Scroll to top on tab switch
                     # Extra scroll trigger for Setup tab (content renders after main scroll)
@@ -7579,6 +7592,8 @@ def main():
             project_name = pm.metadata.name if pm and pm.metadata else "Project"
             st.caption(f"Project: **{project_name}**")
             if st.button("Switch Project", key="switch_project", width="stretch"):
+                from rrational.gui.shared import flush_config
+                flush_config()
                 # Clear current project to show welcome screen
                 st.session_state.current_project = None
                 st.session_state.project_manager = None
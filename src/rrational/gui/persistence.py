@@ -6,10 +6,38 @@ When project_path is provided, config is stored in project/config/ folder.
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+
 import yaml
+from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
+try:
+    from yaml import CSafeDumper as _Dumper, CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _Dumper, SafeLoader as _Loader
+
+# Serializer options shared by every save (built once, not per call)
+_YAML_DUMP_KWARGS: dict[str, Any] = {
+    "Dumper": _Dumper,
+    "default_flow_style": False,
+    "allow_unicode": True,
+}
+_JSON_DUMP_KWARGS: dict[str, Any] = {
+    "separators": (",", ":"),
+    "sort_keys": True,
+    "ensure_ascii": False,
+}
+
 
 CONFIG_DIR = Path.home() / ".rrational"
 LEGACY_CONFIG_DIR = Path.home() / ".music_hrv"  # Pre-v0.7.0 config directory
@@ -21,6 +49,7 @@ PLAYLIST_GROUPS_FILE = CONFIG_DIR / "playlist_groups.yml"
 MUSIC_LABELS_FILE = CONFIG_DIR / "music_labels.yml"
 PROTOCOL_FILE = CONFIG_DIR / "protocol.yml"
 PARTICIPANT_EVENTS_FILE = CONFIG_DIR / "participant_events.yml"
+PARTICIPANT_EVENTS_INDEX_FILE = CONFIG_DIR / "participant_events.index"
 SETTINGS_FILE = CONFIG_DIR / "settings.yml"
 
 # Default settings
@@ -76,14 +105,211 @@ def _convert_numpy_types(obj: Any) -> Any:
         return obj
 
 
+# Parsed YAML keyed by path, tagged with the (mtime_ns, size) it was read at;
+# least recently used entries are dropped beyond _YAML_CACHE_SIZE files
+_YAML_CACHE: dict[Path, tuple[tuple[int, int], Any]] = {}
+_YAML_CACHE_SIZE = 128
+# Script threads and the debounced config flush (a timer thread) share the cache
+_YAML_CACHE_LOCK = threading.Lock()
+
+
+# mkstemp() creates 0600 files; written files get the usual umask-based mode
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
+
+
+def _write_atomic(target: Path, payload: bytes) -> None:
+    """Write a file via a temporary sibling and os.replace().
+
+    A crash mid-write leaves the previous version in place instead of a
+    truncated file that later loads would silently read as empty.
+    """
+    # Each write gets its own temp file, so overlapping saves of the same
+    # target (timer flush, other sessions) never share one
+    fd, tmp = tempfile.mkstemp(dir=target.parent, prefix=target.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+        os.chmod(tmp, _FILE_MODE)
+        os.replace(tmp, target)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def _dump_yaml(target: Path, data: Any) -> None:
+    """Serialize data to YAML in memory, then write the file in one call.
+
+    Dumping straight into a text file issues many small writes; a failing
+    dump would also leave the target truncated.
+    """
+    payload = yaml.dump(data, **_YAML_DUMP_KWARGS).encode("utf-8")
+    _write_atomic(target, payload)
+
+
+def _load_yaml(target: Path) -> Any:
+    """Parse a YAML file, opening it directly instead of checking exists() first.
+
+    The raw bytes go to the parser, which decodes UTF-8 itself instead of
+    going through a text-mode file object.
+
+    Returns:
+        Parsed content ({} for an empty file), or None if the file does not exist
+    """
+    try:
+        raw = target.read_bytes()
+    except FileNotFoundError:
+        return None
+    return yaml.load(raw, Loader=_Loader) or {}
+
+
+def _read_yaml_cached(target: Path) -> Any:
+    """Parse a YAML file, reusing the last parse while the file is unchanged.
+
+    Returns a deep copy so callers can mutate the result (e.g. store it in
+    session state) without corrupting the cache.
+
+    Args:
+        target: Path to the YAML file
+
+    Returns:
+        Parsed content ({} for an empty file), or None if the file does not exist
+    """
+    try:
+        stat = target.stat()
+    except FileNotFoundError:
+        return None
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    with _YAML_CACHE_LOCK:
+        cached = _YAML_CACHE.get(target)
+    if cached is None or cached[0] != stamp:
+        cached = (stamp, _load_yaml(target) or {})
+    with _YAML_CACHE_LOCK:
+        # Re-insert so the dict stays ordered from least to most recently used
+        _YAML_CACHE.pop(target, None)
+        _YAML_CACHE[target] = cached
+        if len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+            del _YAML_CACHE[next(iter(_YAML_CACHE))]
+    return copy.deepcopy(cached[1])
+
+
+def _forget_yaml_cached(target: Path) -> None:
+    """Drop a file's cached parse, e.g. after writing it."""
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE.pop(target, None)
+
+
+def _load_yaml_cached(target: Path) -> dict[str, Any]:
+    """Load a YAML mapping through the parse cache.
+
+    Returns:
+        Parsed dict, or empty dict if the file does not exist
+    """
+    data = _read_yaml_cached(target)
+    return {} if data is None else data
+
+
+# Per-participant data files are written as JSON; YAML is still read for
+# files saved by earlier versions
+_PARTICIPANT_FILE_SUFFIXES = (".json", ".yml")
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize the non-JSON values that yaml.safe_dump used to accept."""
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    converted = _convert_numpy_types(obj)
+    if converted is obj:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return converted
+
+
+def _write_participant_file(stem: Path, data: dict[str, Any]) -> Path:
+    """Write a per-participant data file as compact JSON.
+
+    Args:
+        stem: Target path without suffix (e.g. processed/0001CTRL_events)
+        data: Data to serialize
+
+    Returns:
+        Path to the written file
+    """
+    target = stem.with_name(stem.name + ".json")
+    payload = json.dumps(data, default=_json_default, **_JSON_DUMP_KWARGS).encode("utf-8")
+    _write_atomic(target, payload)
+    return target
+
+
+def _read_participant_file(stem: Path) -> dict[str, Any] | None:
+    """Read a per-participant data file, preferring JSON over legacy YAML.
+
+    Args:
+        stem: Target path without suffix (e.g. processed/0001CTRL_events)
+
+    Returns:
+        Parsed dict, or None if neither file exists
+    """
+    try:
+        raw = stem.with_name(stem.name + ".json").read_bytes()
+    except FileNotFoundError:
+        return _read_yaml_cached(stem.with_name(stem.name + ".yml"))
+    return json.loads(raw) or {}
+
+
+def _unlink_if_exists(target: Path) -> bool:
+    """Delete a file, treating a missing file as nothing to do.
+
+    Unlinking directly saves the stat() call of a separate exists() check.
+
+    Returns:
+        True if the file was deleted
+    """
+    try:
+        target.unlink()
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def _unlink_participant_file(stem: Path) -> bool:
+    """Delete all stored formats of a per-participant data file.
+
+    Returns:
+        True if any file was deleted
+    """
+    deleted_any = False
+    for suffix in _PARTICIPANT_FILE_SUFFIXES:
+        if _unlink_if_exists(stem.with_name(stem.name + suffix)):
+            deleted_any = True
+    return deleted_any
+
+
+# Directories already created (or found) by this process
+_KNOWN_DIRS: set[Path] = set()
+
+
+def _ensure_dir(directory: Path) -> None:
+    """Create a directory (with parents) unless this process already did."""
+    if directory in _KNOWN_DIRS:
+        return
+    directory.mkdir(parents=True, exist_ok=True)
+    _KNOWN_DIRS.add(directory)
+
+
 def ensure_config_dir() -> None:
     """Create config directory if it doesn't exist."""
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(CONFIG_DIR)
 
 
 def _get_config_path(filename: str, project_path: Path | str | None = None) -> Path:
     """Get the path for a config file, supporting project-based storage.
 
+    Read-only: the directory is not created. Use _get_config_path_for_write()
+    before writing.
+
     Args:
         filename: Name of the config file (e.g., 'groups.yml')
         project_path: If provided (Path or str), returns project/config/{filename}
@@ -94,12 +320,17 @@ def _get_config_path(filename: str, project_path: Path | str | None = None) -> P
     """
     if project_path:
         # Ensure project_path is a Path object (handles both Path and str)
-        config_dir = Path(project_path) / "config"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return config_dir / filename
+        return Path(project_path) / "config" / filename
     return CONFIG_DIR / filename
 
 
+def _get_config_path_for_write(filename: str, project_path: Path | str | None = None) -> Path:
+    """Like _get_config_path(), but makes sure the config directory exists."""
+    target = _get_config_path(filename, project_path)
+    _ensure_dir(target.parent)
+    return target
+
+
 def migrate_legacy_config() -> bool:
     """Migrate configuration from legacy ~/.music_hrv to ~/.rrational.
 
@@ -114,11 +345,8 @@ def migrate_legacy_config() -> bool:
     """
     import shutil
 
-    if not LEGACY_CONFIG_DIR.exists():
-        return False  # No legacy config to migrate
-
-    # List of files to migrate
-    legacy_files = [
+    # Files to migrate
+    legacy_files = (
         "groups.yml",
         "events.yml",
         "sections.yml",
@@ -128,33 +356,39 @@ def migrate_legacy_config() -> bool:
         "protocol.yml",
         "participant_events.yml",
         "settings.yml",
-    ]
+    )
+
+    # One directory scan instead of exists()/stat() per candidate file
+    try:
+        with os.scandir(LEGACY_CONFIG_DIR) as it:
+            legacy_sizes = {
+                entry.name: entry.stat().st_size
+                for entry in it
+                if entry.name in legacy_files and entry.is_file()
+            }
+    except (FileNotFoundError, NotADirectoryError):
+        return False  # No legacy config to migrate
 
     migrated_any = False
     ensure_config_dir()
 
     for filename in legacy_files:
-        legacy_file = LEGACY_CONFIG_DIR / filename
-        new_file = CONFIG_DIR / filename
-
-        if not legacy_file.exists():
+        legacy_size = legacy_sizes.get(filename)
+        if legacy_size is None:
             continue
+        new_file = CONFIG_DIR / filename
 
         # Migrate if: new file doesn't exist OR legacy is larger (has more user data)
-        should_migrate = False
-        if not new_file.exists():
+        # (a larger legacy file likely has real user data while the new one only has defaults)
+        try:
+            should_migrate = legacy_size > new_file.stat().st_size
+        except FileNotFoundError:
             should_migrate = True
-        else:
-            # If legacy file is significantly larger, it likely has real user data
-            # while new file only has defaults
-            legacy_size = legacy_file.stat().st_size
-            new_size = new_file.stat().st_size
-            if legacy_size > new_size:
-                should_migrate = True
 
         if should_migrate:
             try:
-                shutil.copy2(legacy_file, new_file)
+                # Contents only: a fresh mtime keeps the stat-keyed YAML cache honest
+                shutil.copyfile(LEGACY_CONFIG_DIR / filename, new_file)
                 migrated_any = True
             except Exception:
                 pass  # Silently continue if copy fails
@@ -171,11 +405,9 @@ def save_groups(groups: dict[str, Any], project_path: Path | None = None) -> Non
         groups: Groups configuration dict
         project_path: If provided, saves to project/config/groups.yml
     """
-    if not project_path:
-        ensure_config_dir()
-    target = _get_config_path("groups.yml", project_path)
-    with open(target, "w", encoding="utf-8") as f:
-        yaml.safe_dump(groups, f, default_flow_style=False, allow_unicode=True)
+    target = _get_config_path_for_write("groups.yml", project_path)
+    _dump_yaml(target, groups)
+    _forget_yaml_cached(target)
 
 
 def load_groups(project_path: Path | None = None) -> dict[str, Any]:
@@ -187,11 +419,7 @@ def load_groups(project_path: Path | None = None) -> dict[str, Any]:
     Returns:
         Groups configuration dict, or empty dict if not found
     """
-    target = _get_config_path("groups.yml", project_path)
-    if not target.exists():
-        return {}
-    with open(target, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    return _load_yaml_cached(_get_config_path("groups.yml", project_path))
 
 
 # --- Events ---
@@ -203,11 +431,9 @@ def save_events(events: dict[str, list[str]], project_path: Path | None = None)
         events: Events configuration dict (canonical -> synonyms)
         project_path: If provided, saves to project/config/events.yml
     """
-    if not project_path:
-        ensure_config_dir()
-    target = _get_config_path("events.yml", project_path)
-    with open(target, "w", encoding="utf-8") as f:
-        yaml.safe_dump(events, f, default_flow_style=False, allow_unicode=True)
+    target = _get_config_path_for_write("events.yml", project_path)
+    _dump_yaml(target, events)
+    _forget_yaml_cached(target)
 
 
 def load_events(project_path: Path | None = None) -> dict[str, list[str]]:
@@ -219,11 +445,7 @@ def load_events(project_path: Path | None = None) -> dict[str, list[str]]:
     Returns:
         Events configuration dict, or empty dict if not found
     """
-    target = _get_config_path("events.yml", project_path)
-    if not target.exists():
-        return {}
-    with open(target, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    return _load_yaml_cached(_get_config_path("events.yml", project_path))
 
 
 # --- Sections ---
@@ -235,11 +457,9 @@ def save_sections(sections: dict[str, Any], project_path: Path | None = None) ->
         sections: Sections configuration dict
         project_path: If provided, saves to project/config/sections.yml
     """
-    if not project_path:
-        ensure_config_dir()
-    target = _get_config_path("sections.yml", project_path)
-    with open(target, "w", encoding="utf-8") as f:
-        yaml.safe_dump(sections, f, default_flow_style=False, allow_unicode=True)
+    target = _get_config_path_for_write("sections.yml", project_path)
+    _dump_yaml(target, sections)
+    _forget_yaml_cached(target)
 
 
 def load_sections(project_path: Path | None = None) -> dict[str, Any]:
@@ -251,11 +471,7 @@ def load_sections(project_path: Path | None = None) -> dict[str, Any]:
     Returns:
         Sections configuration dict, or empty dict if not found
     """
-    target = _get_config_path("sections.yml", project_path)
-    if not target.exists():
-        return {}
-    with open(target, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    return _load_yaml_cached(_get_config_path("sections.yml", project_path))
 
 
 # --- Participants ---
@@ -276,11 +492,9 @@ def save_participants(participants_data: dict[str, Any], project_path: Path | No
         }
     }
     """
-    if not project_path:
-        ensure_config_dir()
-    target = _get_config_path("participants.yml", project_path)
-    with open(target, "w", encoding="utf-8") as f:
-        yaml.safe_dump(participants_data, f, default_flow_style=False, allow_unicode=True)
+    target = _get_config_path_for_write("participants.yml", project_path)
+    _dump_yaml(target, participants_data)
+    _forget_yaml_cached(target)
 
 
 def load_participants(project_path: Path | None = None) -> dict[str, Any]:
@@ -292,11 +506,7 @@ def load_participants(project_path: Path | None = None) -> dict[str, Any]:
     Returns:
         Participants configuration dict, or empty dict if not found
     """
-    target = _get_config_path("participants.yml", project_path)
-    if not target.exists():
-        return {}
-    with open(target, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    return _load_yaml_cached(_get_config_path("participants.yml", project_path))
 
 
 # --- Playlist Groups ---
@@ -320,11 +530,9 @@ def save_playlist_groups(playlist_groups: dict[str, Any], project_path: Path | N
         }
     }
     """
-    if not project_path:
-        ensure_config_dir()
-    target = _get_config_path("playlist_groups.yml", project_path)
-    with open(target, "w", encoding="utf-8") as f:
-        yaml.safe_dump(playlist_groups, f, default_flow_style=False, allow_unicode=True)
+    target = _get_config_path_for_write("playlist_groups.yml", project_path)
+    _dump_yaml(target, playlist_groups)
+    _forget_yaml_cached(target)
 
 
 def load_playlist_groups(project_path: Path | None = None) -> dict[str, Any]:
@@ -336,11 +544,7 @@ def load_playlist_groups(project_path: Path | None = None) -> dict[str, Any]:
     Returns:
         Playlist groups configuration dict, or empty dict if not found
     """
-    target = _get_config_path("playlist_groups.yml", project_path)
-    if not target.exists():
-        return {}
-    with open(target, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    return _load_yaml_cached(_get_config_path("playlist_groups.yml", project_path))
 
 
 # --- Music Labels ---
@@ -364,11 +568,9 @@ def save_music_labels(music_labels: dict[str, Any], project_path: Path | None =
         }
     }
     """
-    if not project_path:
-        ensure_config_dir()
-    target = _get_config_path("music_labels.yml", project_path)
-    with open(target, "w", encoding="utf-8") as f:
-        yaml.safe_dump(music_labels, f, default_flow_style=False, allow_unicode=True)
+    target = _get_config_path_for_write("music_labels.yml", project_path)
+    _dump_yaml(target, music_labels)
+    _forget_yaml_cached(target)
 
 
 def load_music_labels(project_path: Path | None = None) -> dict[str, Any]:
@@ -380,11 +582,7 @@ def load_music_labels(project_path: Path | None = None) -> dict[str, Any]:
     Returns:
         Music labels configuration dict, or empty dict if not found
     """
-    target = _get_config_path("music_labels.yml", project_path)
-    if not target.exists():
-        return {}
-    with open(target, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    return _load_yaml_cached(_get_config_path("music_labels.yml", project_path))
 
 
 # --- Protocol ---
@@ -407,11 +605,8 @@ def save_protocol(protocol: dict[str, Any], project_path: Path | None = None) ->
         "mismatch_strategy": "flag_only"
     }
     """
-    if not project_path:
-        ensure_config_dir()
-    target = _get_config_path("protocol.yml", project_path)
-    with open(target, "w", encoding="utf-8") as f:
-        yaml.safe_dump(protocol, f, default_flow_style=False, allow_unicode=True)
+    target = _get_config_path_for_write("protocol.yml", project_path)
+    _dump_yaml(target, protocol)
 
 
 def load_protocol(project_path: Path | None = None) -> dict[str, Any]:
@@ -423,8 +618,8 @@ def load_protocol(project_path: Path | None = None) -> dict[str, Any]:
     Returns:
         Protocol configuration dict with defaults for missing keys
     """
-    target = _get_config_path("protocol.yml", project_path)
-    if not target.exists():
+    protocol = _load_yaml(_get_config_path("protocol.yml", project_path))
+    if protocol is None:
         return {
             "expected_duration_min": 90.0,
             "section_length_min": 5.0,
@@ -434,44 +629,63 @@ def load_protocol(project_path: Path | None = None) -> dict[str, Any]:
             "min_section_beats": 100,
             "mismatch_strategy": "flag_only",
         }
-    with open(target, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+    return protocol
 
 
 # --- Participant Events ---
 
+_EVENT_FIELDS = attrgetter("raw_label", "canonical", "first_timestamp", "last_timestamp")
+
+
+def _serialize_event(evt: Any) -> dict[str, Any]:
+    """Convert an EventStatus-like object to a plain dict with ISO timestamps."""
+    try:
+        raw_label, canonical, first_ts, last_ts = _EVENT_FIELDS(evt)
+    except AttributeError:
+        # Partial objects (e.g. bare labels) fall back field by field
+        raw_label = getattr(evt, "raw_label", str(evt))
+        canonical = getattr(evt, "canonical", None)
+        first_ts = getattr(evt, "first_timestamp", None)
+        last_ts = getattr(evt, "last_timestamp", None)
+    return {
+        "raw_label": raw_label,
+        "canonical": canonical,
+        "first_timestamp": first_ts.isoformat() if first_ts else first_ts,
+        "last_timestamp": last_ts.isoformat() if last_ts else last_ts,
+    }
+
+
+# Updates to the global participant_events.yml not yet written to disk
+_PENDING_PARTICIPANT_EVENTS: dict[str, dict[str, Any]] = {}
+
+
 def save_participant_events(
     participant_id: str,
     events_data: dict[str, Any],
     data_dir: str | None = None,
     project_path: Path | None = None,
+    *,
+    flush: bool = True,
 ) -> None:
-    """Save participant events (edited events) to YAML.
+    """Save participant events (edited events).
 
     Storage priority:
-    1. If project_path provided: saves to project/processed/{participant_id}_events.yml
-    2. If data_dir provided: saves to {data_dir}/../processed/{participant_id}_events.yml
+    1. If project_path provided: saves to project/processed/{participant_id}_events.json
+    2. If data_dir provided: saves to {data_dir}/../processed/{participant_id}_events.json
     3. Otherwise: saves to ~/.rrational/participant_events.yml (fallback)
 
     This keeps event data with the project for portability.
+
+    The fallback file holds every participant, so rewriting it per save is
+    O(N) each time. Pass ``flush=False`` when saving many participants in a
+    row and call flush_participant_events() once at the end.
     """
     # Convert EventStatus objects to serializable dicts
-    serialized = {"events": [], "manual": [], "music_events": [], "exclusion_zones": []}
-
-    for key in ["events", "manual", "music_events"]:
-        for evt in events_data.get(key, []):
-            evt_dict = {
-                "raw_label": getattr(evt, "raw_label", str(evt)),
-                "canonical": getattr(evt, "canonical", None),
-                "first_timestamp": getattr(evt, "first_timestamp", None),
-                "last_timestamp": getattr(evt, "last_timestamp", None),
-            }
-            # Convert datetime to ISO string for YAML
-            if evt_dict["first_timestamp"]:
-                evt_dict["first_timestamp"] = evt_dict["first_timestamp"].isoformat()
-            if evt_dict["last_timestamp"]:
-                evt_dict["last_timestamp"] = evt_dict["last_timestamp"].isoformat()
-            serialized[key].append(evt_dict)
+    serialized = {
+        key: [_serialize_event(evt) for evt in events_data.get(key, ())]
+        for key in ("events", "manual", "music_events")
+    }
+    serialized["exclusion_zones"] = []
 
     # Handle exclusion zones (already dicts with serializable data)
     for zone in events_data.get("exclusion_zones", []):
@@ -491,8 +705,7 @@ def save_participant_events(
     # Determine save location (priority: project > data_dir > global)
     if project_path:
         processed_dir = Path(project_path) / "processed"
-        processed_dir.mkdir(parents=True, exist_ok=True)
-        participant_file = processed_dir / f"{participant_id}_events.yml"
+        _ensure_dir(processed_dir)
 
         output_data = {
             "participant_id": participant_id,
@@ -501,16 +714,13 @@ def save_participant_events(
             **serialized
         }
 
-        with open(participant_file, "w", encoding="utf-8") as f:
-            yaml.safe_dump(output_data, f, default_flow_style=False, allow_unicode=True)
+        _write_participant_file(processed_dir / f"{participant_id}_events", output_data)
 
     elif data_dir:
         # Save to processed folder (portable with project)
         data_path = Path(data_dir)
         processed_dir = data_path.parent / "processed"
-        processed_dir.mkdir(parents=True, exist_ok=True)
-
-        participant_file = processed_dir / f"{participant_id}_events.yml"
+        _ensure_dir(processed_dir)
 
         output_data = {
             "participant_id": participant_id,
@@ -519,21 +729,63 @@ def save_participant_events(
             **serialized
         }
 
-        with open(participant_file, "w", encoding="utf-8") as f:
-            yaml.safe_dump(output_data, f, default_flow_style=False, allow_unicode=True)
+        _write_participant_file(processed_dir / f"{participant_id}_events", output_data)
     else:
         # Fallback: save to app config (no project folder available)
-        ensure_config_dir()
+        _PENDING_PARTICIPANT_EVENTS[participant_id] = serialized
+        if flush:
+            flush_participant_events()
 
-        all_events = {}
-        if PARTICIPANT_EVENTS_FILE.exists():
-            with open(PARTICIPANT_EVENTS_FILE, "r", encoding="utf-8") as f:
-                all_events = yaml.safe_load(f) or {}
 
-        all_events[participant_id] = serialized
+def flush_participant_events() -> bool:
+    """Write queued fallback participant events to participant_events.yml.
 
-        with open(PARTICIPANT_EVENTS_FILE, "w", encoding="utf-8") as f:
-            yaml.safe_dump(all_events, f, default_flow_style=False, allow_unicode=True)
+    Returns:
+        True if the file was written, False if nothing was pending
+    """
+    if not _PENDING_PARTICIPANT_EVENTS:
+        return False
+    ensure_config_dir()
+
+    all_events = _load_yaml_cached(PARTICIPANT_EVENTS_FILE)
+    all_events.update(_PENDING_PARTICIPANT_EVENTS)
+
+    _write_participant_events_file(all_events)
+    _PENDING_PARTICIPANT_EVENTS.clear()
+    return True
+
+
+def _write_participant_events_file(all_events: dict[str, Any]) -> None:
+    """Write participant_events.yml and its ID index sidecar.
+
+    The index holds the (mtime_ns, size) of the YAML it was written for on
+    its first line, then one participant ID per line, so listing IDs does not
+    need to parse the whole events file.
+    """
+    _dump_yaml(PARTICIPANT_EVENTS_FILE, all_events)
+    _forget_yaml_cached(PARTICIPANT_EVENTS_FILE)
+    mtime_ns, size = _file_stamp(PARTICIPANT_EVENTS_FILE)
+    lines = [f"{mtime_ns} {size}", *sorted(all_events)]
+    _write_atomic(PARTICIPANT_EVENTS_INDEX_FILE, "\n".join(lines).encode("utf-8"))
+
+
+def _read_participant_events_index() -> list[str] | None:
+    """Return the participant IDs stored in participant_events.yml.
+
+    Uses the index sidecar when it matches the current file, otherwise
+    parses the file itself.
+    """
+    stamp = _file_stamp(PARTICIPANT_EVENTS_FILE)
+    if stamp is None:
+        return []
+    try:
+        header, *ids = PARTICIPANT_EVENTS_INDEX_FILE.read_text(encoding="utf-8").split("\n")
+    except FileNotFoundError:
+        header, ids = "", []
+    if header != f"{stamp[0]} {stamp[1]}":
+        # Missing or stale (e.g. file copied by migration or edited by hand)
+        return list(_load_yaml_cached(PARTICIPANT_EVENTS_FILE))
+    return [pid for pid in ids if pid]
 
 
 def load_participant_events(
@@ -541,23 +793,24 @@ def load_participant_events(
     data_dir: str | None = None,
     project_path: Path | None = None,
 ) -> dict[str, Any] | None:
-    """Load saved participant events from YAML.
+    """Load saved participant events.
 
     Storage priority:
-    1. If project_path provided: checks project/processed/{participant_id}_events.yml
-    2. If data_dir provided: checks {data_dir}/../processed/{participant_id}_events.yml
+    1. If project_path provided: checks project/processed/{participant_id}_events.json
+    2. If data_dir provided: checks {data_dir}/../processed/{participant_id}_events.json
     3. Falls back to ~/.rrational/participant_events.yml
 
+    The per-participant locations also accept the ``.yml`` files written by
+    earlier versions.
+
     Returns None if no saved events exist for this participant.
     """
     # First, try to load from project folder
     if project_path:
         processed_dir = Path(project_path) / "processed"
-        participant_file = processed_dir / f"{participant_id}_events.yml"
+        data = _read_participant_file(processed_dir / f"{participant_id}_events")
 
-        if participant_file.exists():
-            with open(participant_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+        if data is not None:
             # Remove metadata fields before returning
             data.pop("participant_id", None)
             data.pop("format_version", None)
@@ -568,28 +821,21 @@ def load_participant_events(
     if data_dir:
         data_path = Path(data_dir)
         processed_dir = data_path.parent / "processed"
-        participant_file = processed_dir / f"{participant_id}_events.yml"
+        data = _read_participant_file(processed_dir / f"{participant_id}_events")
 
-        if participant_file.exists():
-            with open(participant_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+        if data is not None:
             # Remove metadata fields before returning
             data.pop("participant_id", None)
             data.pop("format_version", None)
             data.pop("source_type", None)
             return data
 
-    # Fall back to app config
-    if not PARTICIPANT_EVENTS_FILE.exists():
-        return None
-
-    with open(PARTICIPANT_EVENTS_FILE, "r", encoding="utf-8") as f:
-        all_events = yaml.safe_load(f) or {}
-
-    if participant_id not in all_events:
-        return None
+    # Fall back to app config (unflushed saves win over the file)
+    if participant_id in _PENDING_PARTICIPANT_EVENTS:
+        return copy.deepcopy(_PENDING_PARTICIPANT_EVENTS[participant_id])
 
-    return all_events[participant_id]
+    all_events = _load_yaml_cached(PARTICIPANT_EVENTS_FILE)
+    return all_events.get(participant_id)
 
 
 def delete_participant_events(
@@ -600,8 +846,8 @@ def delete_participant_events(
     """Delete saved events for a participant (reset to original).
 
     Deletes from all locations for backwards compatibility:
-    - project/processed/{participant_id}_events.yml (project folder)
-    - {data_dir}/../processed/{participant_id}_events.yml (data folder)
+    - project/processed/{participant_id}_events.json/.yml (project folder)
+    - {data_dir}/../processed/{participant_id}_events.json/.yml (data folder)
     - ~/.rrational/participant_events.yml (app config)
 
     Returns True if events were deleted from any location, False if none existed.
@@ -611,32 +857,27 @@ def delete_participant_events(
     # Delete from project folder
     if project_path:
         processed_dir = Path(project_path) / "processed"
-        participant_file = processed_dir / f"{participant_id}_events.yml"
-
-        if participant_file.exists():
-            participant_file.unlink()
+        if _unlink_participant_file(processed_dir / f"{participant_id}_events"):
             deleted_any = True
 
     # Delete from data_dir processed folder
     if data_dir:
         data_path = Path(data_dir)
         processed_dir = data_path.parent / "processed"
-        participant_file = processed_dir / f"{participant_id}_events.yml"
-
-        if participant_file.exists():
-            participant_file.unlink()
+        if _unlink_participant_file(processed_dir / f"{participant_id}_events"):
             deleted_any = True
 
     # Delete from app config
-    if PARTICIPANT_EVENTS_FILE.exists():
-        with open(PARTICIPANT_EVENTS_FILE, "r", encoding="utf-8") as f:
-            all_events = yaml.safe_load(f) or {}
+    if _PENDING_PARTICIPANT_EVENTS.pop(participant_id, None) is not None:
+        deleted_any = True
+
+    # The ID index answers "not stored here" without parsing the events file
+    if participant_id in _read_participant_events_index():
+        all_events = _load_yaml_cached(PARTICIPANT_EVENTS_FILE)
 
         if participant_id in all_events:
             del all_events[participant_id]
-
-            with open(PARTICIPANT_EVENTS_FILE, "w", encoding="utf-8") as f:
-                yaml.safe_dump(all_events, f, default_flow_style=False, allow_unicode=True)
+            _write_participant_events_file(all_events)
 
             deleted_any = True
 
@@ -645,16 +886,35 @@ def delete_participant_events(
 
 def list_saved_participant_events() -> list[str]:
     """List all participant IDs that have saved events."""
-    if not PARTICIPANT_EVENTS_FILE.exists():
-        return []
+    saved = _read_participant_events_index()
+    known = set(saved)
+    return saved + [pid for pid in _PENDING_PARTICIPANT_EVENTS if pid not in known]
 
-    with open(PARTICIPANT_EVENTS_FILE, "r", encoding="utf-8") as f:
-        all_events = yaml.safe_load(f) or {}
 
-    return list(all_events.keys())
+# --- Settings (always global) ---
 
+def _deep_merge(base: dict[str, Any], override: dict[str, Any]) -> dict[str, Any]:
+    """Fill keys missing from override with values from base, recursing into dicts.
+
+    Only copies a level when something is missing there; otherwise override
+    itself is returned. Values taken from base are shared, not copied.
+    """
+    merged = override
+    for key, base_value in base.items():
+        if key in override:
+            value = override[key]
+            if not (isinstance(base_value, dict) and isinstance(value, dict)):
+                continue
+            value = _deep_merge(base_value, value)
+            if value is override[key]:
+                continue
+        else:
+            value = base_value
+        if merged is override:
+            merged = dict(override)
+        merged[key] = value
+    return merged
 
-# --- Settings (always global) ---
 
 def save_settings(settings: dict[str, Any]) -> None:
     """Save application settings to YAML.
@@ -671,53 +931,67 @@ def save_settings(settings: dict[str, Any]) -> None:
     """
     ensure_config_dir()
     # Merge with defaults to ensure all keys exist
-    merged = {**DEFAULT_SETTINGS, **settings}
-    if "plot_options" in settings:
-        merged["plot_options"] = {**DEFAULT_SETTINGS["plot_options"], **settings["plot_options"]}
-        # Also merge nested colors within plot_options
-        if "colors" in settings["plot_options"]:
-            merged["plot_options"]["colors"] = {
-                **DEFAULT_SETTINGS["plot_options"]["colors"],
-                **settings["plot_options"]["colors"]
-            }
-        else:
-            merged["plot_options"]["colors"] = DEFAULT_SETTINGS["plot_options"]["colors"].copy()
-    with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-        yaml.safe_dump(merged, f, default_flow_style=False, allow_unicode=True)
+    merged = _deep_merge(DEFAULT_SETTINGS, settings)
+    _dump_yaml(SETTINGS_FILE, merged)
+
+    # What was just written is what the next load would return
+    global _SETTINGS_CACHE
+    _SETTINGS_CACHE = (_file_stamp(SETTINGS_FILE), copy.deepcopy(merged))
+
+
+# Merged settings keyed by the (mtime_ns, size) of settings.yml (None: no file)
+_SETTINGS_CACHE: tuple[tuple[int, int] | None, dict[str, Any]] | None = None
+
+
+def _file_stamp(target: Path) -> tuple[int, int] | None:
+    """Return (mtime_ns, size) of a file, or None if it does not exist."""
+    try:
+        stat = target.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _cached_settings() -> dict[str, Any]:
+    """Return the merged settings, re-reading settings.yml only when it changed.
+
+    The returned dict is shared; callers must not mutate it.
+    """
+    global _SETTINGS_CACHE
+    stamp = _file_stamp(SETTINGS_FILE)
+    if _SETTINGS_CACHE is None or _SETTINGS_CACHE[0] != stamp:
+        _SETTINGS_CACHE = (stamp, _read_settings())
+    return _SETTINGS_CACHE[1]
 
 
 def load_settings() -> dict[str, Any]:
     """Load application settings from YAML, with defaults for missing keys."""
-    if not SETTINGS_FILE.exists():
-        return DEFAULT_SETTINGS.copy()
+    return copy.deepcopy(_cached_settings())
 
-    with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-        saved = yaml.safe_load(f) or {}
+
+def _read_settings() -> dict[str, Any]:
+    """Parse settings.yml and fill in defaults for missing keys."""
+    saved = _load_yaml(SETTINGS_FILE)
+    if saved is None:
+        return DEFAULT_SETTINGS.copy()
 
     # Merge with defaults to handle missing keys
-    result = {**DEFAULT_SETTINGS, **saved}
-    if "plot_options" in saved:
-        result["plot_options"] = {**DEFAULT_SETTINGS["plot_options"], **saved.get("plot_options", {})}
-        # Also merge nested colors within plot_options
-        saved_colors = saved.get("plot_options", {}).get("colors", {})
-        result["plot_options"]["colors"] = {
-            **DEFAULT_SETTINGS["plot_options"]["colors"],
-            **saved_colors
-        }
-    else:
-        result["plot_options"] = DEFAULT_SETTINGS["plot_options"].copy()
+    return _deep_merge(DEFAULT_SETTINGS, saved)
+
 
-    return result
+@lru_cache(maxsize=256)
+def _key_parts(key: str) -> tuple[str, ...]:
+    """Split a dotted settings key once per distinct key."""
+    return tuple(key.split("."))
 
 
 def get_setting(key: str, default: Any = None) -> Any:
     """Get a single setting value."""
-    settings = load_settings()
+    settings = _cached_settings()
     if "." in key:
         # Support nested keys like "plot_options.show_events"
-        parts = key.split(".")
         value = settings
-        for part in parts:
+        for part in _key_parts(key):
             if isinstance(value, dict):
                 value = value.get(part)
             else:
@@ -776,7 +1050,7 @@ def get_processed_dir(
     else:
         processed_dir = CONFIG_DIR / "exports"
 
-    processed_dir.mkdir(parents=True, exist_ok=True)
+    _ensure_dir(processed_dir)
     return processed_dir
 
 
@@ -818,7 +1092,7 @@ def save_artifact_corrections(
     segment_beats: int | None = None,
     indices_by_type: dict[str, list[int]] | None = None,
 ) -> Path:
-    """Save artifact corrections (algorithm-detected, manual markings, and exclusions) to YAML.
+    """Save artifact corrections (algorithm-detected, manual markings, and exclusions) to JSON.
 
     Artifacts are stored per-section, allowing independent detection for different parts
     of the recording. The section_key identifies which section these artifacts belong to.
@@ -827,9 +1101,9 @@ def save_artifact_corrections(
     corrected RR intervals. Use save_nn_intervals() for the corrected data.
 
     Storage priority:
-    1. If project_path provided: saves to project/data/processed/{participant_id}_artifacts.yml
-    2. If data_dir provided: saves to {data_dir}/../processed/{participant_id}_artifacts.yml
-    3. Otherwise: saves to ~/.rrational/{participant_id}_artifacts.yml (fallback)
+    1. If project_path provided: saves to project/data/processed/{participant_id}_artifacts.json
+    2. If data_dir provided: saves to {data_dir}/../processed/{participant_id}_artifacts.json
+    3. Otherwise: saves to ~/.rrational/exports/{participant_id}_artifacts.json (fallback)
 
     Args:
         participant_id: The participant ID
@@ -848,20 +1122,17 @@ def save_artifact_corrections(
     Returns:
         Path to the saved file
     """
-    from datetime import datetime
+    now_iso = datetime.now().isoformat()
 
     # Use the same processed directory as .rrational files
     processed_dir = get_processed_dir(data_dir=data_dir, project_path=project_path)
-    artifact_file = processed_dir / f"{participant_id}_artifacts.yml"
+    artifact_stem = processed_dir / f"{participant_id}_artifacts"
 
     # Load existing data if file exists (to preserve other sections)
-    existing_data = {}
-    if artifact_file.exists():
-        try:
-            with open(artifact_file, "r", encoding="utf-8") as f:
-                existing_data = yaml.safe_load(f) or {}
-        except Exception:
-            existing_data = {}
+    try:
+        existing_data = _read_participant_file(artifact_stem) or {}
+    except Exception:
+        existing_data = {}
 
     # Migrate old format (v1.2 and earlier) to new section-based format (v1.3)
     if existing_data.get("format_version", "1.0") < "1.3" and "sections" not in existing_data:
@@ -895,7 +1166,7 @@ def save_artifact_corrections(
         "manual_artifacts": manual_artifacts,
         "excluded_artifact_indices": list(artifact_exclusions) if artifact_exclusions else [],
         "scope": scope,
-        "saved_at": datetime.now().isoformat(),
+        "saved_at": now_iso,
     }
 
     # Add optional fields
@@ -920,12 +1191,9 @@ def save_artifact_corrections(
     existing_data["participant_id"] = participant_id
     existing_data["format_version"] = "1.3"
     existing_data["source_type"] = "rrational_toolkit"
-    existing_data["last_modified"] = datetime.now().isoformat()
+    existing_data["last_modified"] = now_iso
 
-    with open(artifact_file, "w", encoding="utf-8") as f:
-        yaml.safe_dump(existing_data, f, default_flow_style=False, allow_unicode=True)
-
-    return artifact_file
+    return _write_participant_file(artifact_stem, existing_data)
 
 
 def load_artifact_corrections(
@@ -934,7 +1202,7 @@ def load_artifact_corrections(
     project_path: Path | None = None,
     section_key: str | None = None,
 ) -> dict[str, Any] | None:
-    """Load saved artifact corrections from YAML.
+    """Load saved artifact corrections (JSON, or YAML written by earlier versions).
 
     Uses the same processed directory as .rrational files (via get_processed_dir).
     Also checks ~/.rrational/ as fallback for legacy files.
@@ -957,16 +1225,16 @@ def load_artifact_corrections(
     """
     # Primary location: same as .rrational files
     processed_dir = get_processed_dir(data_dir=data_dir, project_path=project_path)
-    artifact_file = processed_dir / f"{participant_id}_artifacts.yml"
 
     # Also check legacy location as fallback
-    search_paths = [artifact_file, CONFIG_DIR / f"{participant_id}_artifacts.yml"]
-
-    for artifact_file in search_paths:
-        if artifact_file.exists():
-            with open(artifact_file, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+    search_stems = [
+        processed_dir / f"{participant_id}_artifacts",
+        CONFIG_DIR / f"{participant_id}_artifacts",
+    ]
 
+    for artifact_stem in search_stems:
+        data = _read_participant_file(artifact_stem)
+        if data is not None:
             # Handle v1.3+ format with sections
             if data.get("format_version", "1.0") >= "1.3" and "sections" in data:
                 if section_key is not None:
@@ -1019,6 +1287,18 @@ def load_artifact_corrections(
     return None
 
 
+def load_artifacts_file(directory: str | Path, participant_id: str) -> dict[str, Any] | None:
+    """Read the raw artifacts file of a participant from a given directory.
+
+    Used when the directory is known from elsewhere (e.g. next to a .rrational
+    export) rather than derived from data_dir/project_path.
+
+    Returns:
+        The stored data as-is, or None if no artifacts file exists there
+    """
+    return _read_participant_file(Path(directory) / f"{participant_id}_artifacts")
+
+
 def list_artifact_sections(
     participant_id: str,
     data_dir: str | None = None,
@@ -1137,14 +1417,13 @@ def delete_artifact_corrections(
 
     # Primary location: same as .rrational files
     processed_dir = get_processed_dir(data_dir=data_dir, project_path=project_path)
-    delete_paths = [
-        processed_dir / f"{participant_id}_artifacts.yml",
-        CONFIG_DIR / f"{participant_id}_artifacts.yml",  # Legacy fallback
+    delete_stems = [
+        processed_dir / f"{participant_id}_artifacts",
+        CONFIG_DIR / f"{participant_id}_artifacts",  # Legacy fallback
     ]
 
-    for artifact_file in delete_paths:
-        if artifact_file.exists():
-            artifact_file.unlink()
+    for artifact_stem in delete_stems:
+        if _unlink_participant_file(artifact_stem):
             deleted_any = True
 
     return deleted_any
@@ -1156,7 +1435,7 @@ def load_artifact_corrections_from_rrational(
     """Load artifact markings from a .rrational export file.
 
     This allows restoring artifact markings from a previously exported file
-    when no _artifacts.yml exists (fallback).
+    when no _artifacts.json/.yml exists (fallback).
 
     Args:
         rrational_file: Path to the .rrational file
@@ -1165,27 +1444,24 @@ def load_artifact_corrections_from_rrational(
         Dict with 'manual_artifacts' (list) and 'excluded_artifact_indices' (list),
         or None if file doesn't exist or has no artifact data.
     """
-    if not rrational_file.exists():
-        return None
-
     try:
-        with open(rrational_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        data = _load_yaml(rrational_file) or {}
 
         processing = data.get("processing", {})
         manual_artifacts = processing.get("manual_artifacts", [])
         excluded_indices = processing.get("excluded_detected_indices", [])
 
         # Convert ManualArtifact format to session state format
-        converted_manual = []
-        for ma in manual_artifacts:
-            converted_manual.append({
-                "original_idx": ma.get("original_idx", 0),
+        converted_manual = [
+            {
+                "original_idx": (original_idx := ma.get("original_idx", 0)),
                 "timestamp": ma.get("timestamp", ""),
                 "rr_value": ma.get("rr_value", 0),
                 "source": ma.get("source", "manual"),
-                "plot_idx": ma.get("original_idx", 0),  # Use original_idx as plot_idx
-            })
+                "plot_idx": original_idx,  # Use original_idx as plot_idx
+            }
+            for ma in manual_artifacts
+        ]
 
         if converted_manual or excluded_indices:
             return {
@@ -1255,8 +1531,6 @@ def save_section_validations(
     Returns:
         Path to the saved file
     """
-    from datetime import datetime as dt
-
     # Determine save location
     processed_dir = get_processed_dir(data_dir=data_dir, project_path=project_path)
     validation_file = processed_dir / f"{participant_id}_section_validations.yml"
@@ -1266,12 +1540,12 @@ def save_section_validations(
         "participant_id": participant_id,
         "group": group,
         "format_version": "1.0",
-        "saved_at": dt.now().isoformat(),
+        "saved_at": datetime.now().isoformat(),
         "sections": section_validations,
     }
 
-    with open(validation_file, "w", encoding="utf-8") as f:
-        yaml.safe_dump(output_data, f, default_flow_style=False, allow_unicode=True)
+    _dump_yaml(validation_file, output_data)
+    _forget_yaml_cached(validation_file)
 
     return validation_file
 
@@ -1302,19 +1576,19 @@ def load_section_validations(
     ]
 
     for file_path in search_paths:
-        if file_path.exists():
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
+        try:
+            data = _read_yaml_cached(file_path)
+        except Exception:
+            continue
+        if data is None:
+            continue
 
-                return {
-                    "group": data.get("group", ""),
-                    "sections": data.get("sections", {}),
-                    "saved_at": data.get("saved_at"),
-                    "format_version": data.get("format_version", "1.0"),
-                }
-            except Exception:
-                continue
+        return {
+            "group": data.get("group", ""),
+            "sections": data.get("sections", {}),
+            "saved_at": data.get("saved_at"),
+            "format_version": data.get("format_version", "1.0"),
+        }
 
     return None
 
@@ -1338,8 +1612,7 @@ def delete_section_validations(
     ]
 
     for file_path in delete_paths:
-        if file_path.exists():
-            file_path.unlink()
+        if _unlink_if_exists(file_path):
             deleted_any = True
 
     return deleted_any
@@ -1354,29 +1627,150 @@ def list_participants_with_section_validations(
     Returns:
         List of participant IDs
     """
-    participants = []
+    suffix = "_section_validations.yml"
+    participants: set[str] = set()
 
-    # Check processed directory
+    # Check processed directory, then the legacy location
     processed_dir = get_processed_dir(data_dir=data_dir, project_path=project_path)
-    if processed_dir.exists():
-        for file_path in processed_dir.glob("*_section_validations.yml"):
-            # Extract participant ID from filename
-            pid = file_path.stem.replace("_section_validations", "")
-            if pid:
-                participants.append(pid)
-
-    # Also check legacy location
-    if CONFIG_DIR.exists():
-        for file_path in CONFIG_DIR.glob("*_section_validations.yml"):
-            pid = file_path.stem.replace("_section_validations", "")
-            if pid and pid not in participants:
-                participants.append(pid)
+    for directory in (processed_dir, CONFIG_DIR):
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith(suffix) and entry.is_file():
+                        # Extract participant ID from filename
+                        pid = entry.name[:-len(suffix)]
+                        if pid:
+                            participants.add(pid)
+        except FileNotFoundError:
+            continue
 
     return sorted(participants)
 
 
 # --- NN Intervals (corrected intervals per section) ---
 
+# Section fields repeated in the participant's NN index; the full section
+# metadata, including the corrections list, lives in a per-section file
+_NN_INDEX_FIELDS = ("correction_method", "corrected_at", "final_nn_count", "intervals_corrected", "intervals_file")
+
+# Intervals are stored as binary .npy arrays; CSV is still read for sections
+# saved before format 3.0
+_NN_INTERVAL_SUFFIXES = (".npy", ".csv")
+_NN_INTERVAL_DTYPE = [("ts_ms", "<i8"), ("nn_ms", "<f8"), ("was_corrected", "?")]
+
+
+def _nn_intervals_stem(processed_dir: Path, participant_id: str, section_name: str) -> Path:
+    """Get the path (without suffix) of a section's NN intervals file."""
+    return processed_dir / f"{participant_id}_{section_name}_nn"
+
+
+def _nn_section_stem(processed_dir: Path, participant_id: str, section_name: str) -> Path:
+    """Get the path (without suffix) of a section's NN metadata file."""
+    return processed_dir / f"{participant_id}_{section_name}_nn.meta"
+
+
+def _write_nn_section_meta(
+    processed_dir: Path,
+    participant_id: str,
+    section_name: str,
+    section_metadata: dict[str, Any],
+) -> dict[str, Any]:
+    """Write a section's NN metadata file.
+
+    Returns:
+        The entry to store for the section in the participant's NN index
+    """
+    meta_file = _write_participant_file(
+        _nn_section_stem(processed_dir, participant_id, section_name), section_metadata
+    )
+    entry = {field: section_metadata[field] for field in _NN_INDEX_FIELDS if field in section_metadata}
+    entry["meta_file"] = meta_file.name
+    return entry
+
+
+def _read_nn_section_meta(
+    processed_dir: Path,
+    participant_id: str,
+    section_name: str,
+    entry: dict[str, Any],
+) -> dict[str, Any]:
+    """Resolve a section's NN index entry to its full metadata.
+
+    Index files written before format 2.1 hold the full metadata inline.
+    """
+    if "meta_file" not in entry:
+        return entry
+    section_meta = _read_participant_file(_nn_section_stem(processed_dir, participant_id, section_name))
+    return entry if section_meta is None else section_meta
+
+
+def _pack_nn_intervals(intervals: list) -> bytes:
+    """Serialize a section's NN intervals to the bytes of a .npy file.
+
+    Args:
+        intervals: List of [timestamp_ms, nn_ms, was_corrected] rows
+
+    Returns:
+        Contents for the section's intervals file
+    """
+    import numpy as np
+
+    rows = np.array(
+        [(interval[0], interval[1], bool(interval[2])) for interval in intervals if len(interval) >= 3],
+        dtype=_NN_INTERVAL_DTYPE,
+    )
+    buffer = io.BytesIO()
+    np.save(buffer, rows, allow_pickle=False)
+    return buffer.getvalue()
+
+
+def _nn_content_sha(intervals_payload: bytes, section_metadata: dict[str, Any]) -> str:
+    """Fingerprint a section's NN data to detect saves that change nothing.
+
+    corrected_at is left out: callers stamp it on every save.
+    """
+    digest = hashlib.sha256(intervals_payload)
+    fields = {key: value for key, value in section_metadata.items() if key != "corrected_at"}
+    digest.update(json.dumps(fields, default=_json_default, **_JSON_DUMP_KWARGS).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _read_nn_intervals(stem: Path) -> list[list] | None:
+    """Read a section's NN intervals, preferring .npy over legacy CSV.
+
+    Returns:
+        List of [timestamp_ms, nn_ms, was_corrected] rows, or None if neither file exists
+    """
+    import numpy as np
+
+    try:
+        rows = np.load(stem.with_name(stem.name + ".npy"), allow_pickle=False)
+    except FileNotFoundError:
+        csv_file = stem.with_name(stem.name + ".csv")
+        return _load_nn_csv(csv_file) if csv_file.exists() else None
+    return list(map(list, zip(rows["ts_ms"].tolist(), rows["nn_ms"].tolist(), rows["was_corrected"].tolist())))
+
+
+def _count_nn_intervals(stem: Path) -> int | None:
+    """Count a section's NN intervals without reading the interval data.
+
+    The row count of a .npy file is read from its header; legacy CSV
+    files are still read in full.
+
+    Returns:
+        Number of intervals, or None if neither file exists
+    """
+    import numpy as np
+
+    try:
+        # Memory-mapping reads only the header, for any .npy format version
+        rows = np.load(stem.with_name(stem.name + ".npy"), mmap_mode="r", allow_pickle=False)
+    except FileNotFoundError:
+        intervals = _read_nn_intervals(stem)
+        return None if intervals is None else len(intervals)
+    return rows.shape[0]
+
+
 def save_nn_intervals(
     participant_id: str,
     section_name: str,
@@ -1389,12 +1783,15 @@ def save_nn_intervals(
     This stores the artifact-corrected (interpolated) NN intervals that are
     ready for HRV analysis. Data is saved in two files:
 
-    1. CSV file: `{participant_id}_{section}_nn.csv` - the actual interval data
-       Columns: beat_idx, timestamp_ms, nn_ms, was_corrected
+    1. Intervals file: `{participant_id}_{section}_nn.npy` - the actual interval data
+       Structured array with fields: ts_ms, nn_ms, was_corrected
 
-    2. Metadata file: `{participant_id}_nn_metadata.yml` - correction info for all sections
+    2. Metadata file: `{participant_id}_{section}_nn.meta.json` - correction info
        Contains: correction_method, timestamps, beat counts, correction details
 
+    A small index, `{participant_id}_nn_metadata.json`, lists the saved sections,
+    so saving one section never rewrites the metadata of the others.
+
     Storage location:
     1. If project_path: project/data/processed/
     2. If data_dir: {data_dir}/../processed/
@@ -1428,61 +1825,75 @@ def save_nn_intervals(
         project_path: Project path (takes priority if provided)
 
     Returns:
-        Path to the CSV file
+        Path to the intervals file
     """
-    from datetime import datetime as dt
+    now_iso = datetime.now().isoformat()
 
     # Determine save location
     processed_dir = get_processed_dir(data_dir=data_dir, project_path=project_path)
 
-    # Save CSV file with interval data
-    csv_file = processed_dir / f"{participant_id}_{section_name}_nn.csv"
-    intervals = nn_data.get("intervals", [])
+    intervals_stem = _nn_intervals_stem(processed_dir, participant_id, section_name)
+    intervals_file = intervals_stem.with_name(intervals_stem.name + ".npy")
+    intervals_payload = _pack_nn_intervals(nn_data.get("intervals", []))
 
-    with open(csv_file, "w", encoding="utf-8", newline="") as f:
-        f.write("beat_idx,timestamp_ms,nn_ms,was_corrected\n")
-        for i, interval in enumerate(intervals):
-            if len(interval) >= 3:
-                ts_ms, nn_ms, was_corrected = interval[0], interval[1], interval[2]
-                f.write(f"{i},{ts_ms},{nn_ms},{str(was_corrected).lower()}\n")
+    # Metadata for this section (without the intervals - those have their own file)
+    section_metadata = {
+        "correction_method": nn_data.get("correction_method"),
+        "corrected_at": nn_data.get("corrected_at"),
+        "original_beat_count": nn_data.get("original_beat_count"),
+        "artifacts_removed": nn_data.get("artifacts_removed"),
+        "intervals_corrected": nn_data.get("intervals_corrected"),
+        "final_nn_count": nn_data.get("final_nn_count"),
+        "corrections": nn_data.get("corrections", []),
+        "intervals_file": intervals_file.name,
+    }
+    # Convert numpy types to native Python types for serialization
+    section_metadata = _convert_numpy_types(section_metadata)
+    content_sha = _nn_content_sha(intervals_payload, section_metadata)
 
-    # Save/update metadata file
-    metadata_file = processed_dir / f"{participant_id}_nn_metadata.yml"
+    # Load the metadata index
+    metadata_stem = processed_dir / f"{participant_id}_nn_metadata"
+    metadata = _read_participant_file(metadata_stem)
 
-    if metadata_file.exists():
-        with open(metadata_file, "r", encoding="utf-8") as f:
-            metadata = yaml.safe_load(f) or {}
+    if metadata is not None:
         # Ensure required keys exist (handle older/malformed files)
         if "sections" not in metadata:
             metadata["sections"] = {}
+
+        # Re-saving unchanged data (e.g. after a GUI rerun) leaves the files as they are
+        entry = metadata["sections"].get(section_name) or {}
+        if entry.get("content_sha") == content_sha and intervals_file.exists():
+            return intervals_file
     else:
         metadata = {
             "participant_id": participant_id,
-            "format_version": "2.0",
-            "created_at": dt.now().isoformat(),
+            "created_at": now_iso,
             "sections": {},
         }
 
-    # Store metadata for this section (without the intervals - those are in CSV)
-    section_metadata = {
-        "correction_method": nn_data.get("correction_method"),
-        "corrected_at": nn_data.get("corrected_at"),
-        "original_beat_count": nn_data.get("original_beat_count"),
-        "artifacts_removed": nn_data.get("artifacts_removed"),
-        "intervals_corrected": nn_data.get("intervals_corrected"),
-        "final_nn_count": nn_data.get("final_nn_count"),
-        "corrections": nn_data.get("corrections", []),
-        "csv_file": csv_file.name,
-    }
-    # Convert numpy types to native Python types for YAML serialization
-    section_metadata = _convert_numpy_types(section_metadata)
-    metadata["sections"][section_name] = section_metadata
-    metadata["last_modified"] = dt.now().isoformat()
+    # Save interval data
+    _write_atomic(intervals_file, intervals_payload)
+    # Drop a CSV left over from format 2.x
+    intervals_stem.with_name(intervals_stem.name + ".csv").unlink(missing_ok=True)
+
+    # Move metadata held inline by a pre-2.1 index into per-section files
+    for sec_name, entry in metadata["sections"].items():
+        if "meta_file" not in entry:
+            metadata["sections"][sec_name] = _write_nn_section_meta(
+                processed_dir, participant_id, sec_name, entry
+            )
 
-    with open(metadata_file, "w", encoding="utf-8") as f:
-        yaml.safe_dump(metadata, f, default_flow_style=False, allow_unicode=True)
+    entry = _write_nn_section_meta(processed_dir, participant_id, section_name, section_metadata)
+    entry["content_sha"] = content_sha
+    metadata["sections"][section_name] = entry
+    metadata["format_version"] = "3.0"
+    metadata["last_modified"] = now_iso
 
-    return csv_file
+    _write_participant_file(metadata_stem, metadata)
+    # Drop a metadata file left over from the YAML format
+    metadata_stem.with_name(metadata_stem.name + ".yml").unlink(missing_ok=True)
+
+    return intervals_file
 
 
 def load_nn_intervals(
@@ -1493,7 +1904,8 @@ def load_nn_intervals(
 ) -> dict[str, Any] | None:
     """Load corrected NN intervals for a participant.
 
-    Supports both v2.0 format (CSV + metadata) and legacy v1.0 format (single YAML).
+    Supports v3.0 (.npy + metadata), v2.x (CSV + metadata) and legacy v1.0
+    format (single YAML).
 
     Args:
         participant_id: The participant ID
@@ -1515,30 +1927,31 @@ def load_nn_intervals(
     """
     processed_dir = get_processed_dir(data_dir=data_dir, project_path=project_path)
 
-    # Try v2.0 format first (metadata YAML + CSV files)
-    metadata_file = processed_dir / f"{participant_id}_nn_metadata.yml"
-    if metadata_file.exists():
+    # Try v2.0+ format first (metadata + per-section interval files)
+    try:
+        metadata = _read_participant_file(processed_dir / f"{participant_id}_nn_metadata")
+    except Exception:
+        metadata = None
+    if metadata is not None:
         try:
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                metadata = yaml.safe_load(f) or {}
-
             if section_name:
                 # Load specific section
-                section_meta = metadata.get("sections", {}).get(section_name)
-                if section_meta:
-                    # Load intervals from CSV
-                    csv_file = processed_dir / f"{participant_id}_{section_name}_nn.csv"
-                    if csv_file.exists():
-                        intervals = _load_nn_csv(csv_file)
+                entry = metadata.get("sections", {}).get(section_name)
+                if entry:
+                    section_meta = _read_nn_section_meta(processed_dir, participant_id, section_name, entry)
+                    intervals = _read_nn_intervals(
+                        _nn_intervals_stem(processed_dir, participant_id, section_name)
+                    )
+                    if intervals is not None:
                         return {**section_meta, "intervals": intervals}
                 return None
             else:
                 # Load all sections
                 sections = {}
-                for sec_name, sec_meta in metadata.get("sections", {}).items():
-                    csv_file = processed_dir / f"{participant_id}_{sec_name}_nn.csv"
-                    if csv_file.exists():
-                        intervals = _load_nn_csv(csv_file)
+                for sec_name, entry in metadata.get("sections", {}).items():
+                    sec_meta = _read_nn_section_meta(processed_dir, participant_id, sec_name, entry)
+                    intervals = _read_nn_intervals(_nn_intervals_stem(processed_dir, participant_id, sec_name))
+                    if intervals is not None:
                         sections[sec_name] = {**sec_meta, "intervals": intervals}
                     else:
                         sections[sec_name] = sec_meta
@@ -1558,44 +1971,50 @@ def load_nn_intervals(
     ]
 
     for file_path in legacy_paths:
-        if file_path.exists():
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f) or {}
-
-                if section_name:
-                    sections = data.get("sections", {})
-                    return sections.get(section_name)
-                else:
-                    return {
-                        "sections": data.get("sections", {}),
-                        "last_modified": data.get("last_modified"),
-                        "format_version": data.get("format_version", "1.0"),
-                    }
-            except Exception:
+        try:
+            data = _read_yaml_cached(file_path)
+            if data is None:
                 continue
 
+            if section_name:
+                sections = data.get("sections", {})
+                return sections.get(section_name)
+            else:
+                return {
+                    "sections": data.get("sections", {}),
+                    "last_modified": data.get("last_modified"),
+                    "format_version": data.get("format_version", "1.0"),
+                }
+        except Exception:
+            continue
+
     return None
 
 
 def _load_nn_csv(csv_file: Path) -> list[list]:
     """Load NN intervals from CSV file.
 
+    The columns are parsed by numpy's C reader instead of splitting and
+    converting every line in Python.
+
     Returns:
         List of [timestamp_ms, nn_ms, was_corrected] tuples.
     """
-    intervals = []
-    with open(csv_file, "r", encoding="utf-8") as f:
-        next(f)  # Skip header
-        for line in f:
-            parts = line.strip().split(",")
-            if len(parts) >= 4:
-                # beat_idx, timestamp_ms, nn_ms, was_corrected
-                ts_ms = int(parts[1])
-                nn_ms = float(parts[2])
-                was_corrected = parts[3].lower() == "true"
-                intervals.append([ts_ms, nn_ms, was_corrected])
-    return intervals
+    import numpy as np
+
+    # beat_idx, timestamp_ms, nn_ms, was_corrected
+    _header, _, body = csv_file.read_text(encoding="utf-8").partition("\n")
+    if not body.strip():
+        return []
+    rows = np.loadtxt(
+        io.StringIO(body),
+        delimiter=",",
+        usecols=(1, 2, 3),
+        dtype=[("ts_ms", "i8"), ("nn_ms", "f8"), ("was_corrected", "U5")],
+        ndmin=1,
+    )
+    was_corrected = np.isin(rows["was_corrected"], ("true", "True", "TRUE"))
+    return list(map(list, zip(rows["ts_ms"].tolist(), rows["nn_ms"].tolist(), was_corrected.tolist())))
 
 
 def delete_nn_intervals(
@@ -1606,7 +2025,7 @@ def delete_nn_intervals(
 ) -> bool:
     """Delete saved NN intervals for a participant.
 
-    Handles both v2.0 format (CSV + metadata) and legacy v1.0 format (single YAML).
+    Handles v2.0+ format (interval files + metadata) and legacy v1.0 format (single YAML).
 
     Args:
         participant_id: The participant ID
@@ -1621,36 +2040,39 @@ def delete_nn_intervals(
     deleted_any = False
     processed_dir = get_processed_dir(data_dir=data_dir, project_path=project_path)
 
-    # Handle v2.0 format (CSV + metadata)
-    metadata_file = processed_dir / f"{participant_id}_nn_metadata.yml"
-    if metadata_file.exists():
-        if section_name:
-            # Delete specific section's CSV and update metadata
-            csv_file = processed_dir / f"{participant_id}_{section_name}_nn.csv"
-            if csv_file.exists():
-                csv_file.unlink()
+    # Handle v2.0+ format (interval files + metadata)
+    metadata_stem = processed_dir / f"{participant_id}_nn_metadata"
+    if section_name:
+        try:
+            metadata = _read_participant_file(metadata_stem)
+        except Exception:
+            metadata = {}  # Unreadable index: still remove the section's files
+        if metadata is not None:
+            # Delete specific section's intervals and metadata, then update the index
+            intervals_stem = _nn_intervals_stem(processed_dir, participant_id, section_name)
+            for suffix in _NN_INTERVAL_SUFFIXES:
+                if _unlink_if_exists(intervals_stem.with_name(intervals_stem.name + suffix)):
+                    deleted_any = True
+            if _unlink_participant_file(_nn_section_stem(processed_dir, participant_id, section_name)):
                 deleted_any = True
 
             try:
-                with open(metadata_file, "r", encoding="utf-8") as f:
-                    metadata = yaml.safe_load(f) or {}
-
                 if section_name in metadata.get("sections", {}):
                     del metadata["sections"][section_name]
-                    metadata["last_modified"] = __import__("datetime").datetime.now().isoformat()
+                    metadata["last_modified"] = datetime.now().isoformat()
 
-                    with open(metadata_file, "w", encoding="utf-8") as f:
-                        yaml.safe_dump(metadata, f, default_flow_style=False, allow_unicode=True)
+                    _write_participant_file(metadata_stem, metadata)
                     deleted_any = True
             except Exception:
                 pass
-        else:
-            # Delete all CSV files for this participant
-            for csv_file in processed_dir.glob(f"{participant_id}_*_nn.csv"):
-                csv_file.unlink()
-                deleted_any = True
-            metadata_file.unlink()
-            deleted_any = True
+    elif _unlink_participant_file(metadata_stem):
+        # Delete all interval and section metadata files for this participant
+        for suffix in _NN_INTERVAL_SUFFIXES:
+            for intervals_file in processed_dir.glob(f"{participant_id}_*_nn{suffix}"):
+                intervals_file.unlink()
+        for meta_file in processed_dir.glob(f"{participant_id}_*_nn.meta.json"):
+            meta_file.unlink()
+        deleted_any = True
 
     # Also handle legacy v1.0 format
     legacy_paths = [
@@ -1659,24 +2081,21 @@ def delete_nn_intervals(
     ]
 
     for file_path in legacy_paths:
-        if file_path.exists():
-            if section_name:
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        data = yaml.safe_load(f) or {}
-
-                    if section_name in data.get("sections", {}):
-                        del data["sections"][section_name]
-                        data["last_modified"] = __import__("datetime").datetime.now().isoformat()
-
-                        with open(file_path, "w", encoding="utf-8") as f:
-                            yaml.safe_dump(data, f, default_flow_style=False, allow_unicode=True)
-                        deleted_any = True
-                except Exception:
-                    pass
-            else:
-                file_path.unlink()
-                deleted_any = True
+        if section_name:
+            try:
+                data = _load_yaml(file_path) or {}
+
+                if section_name in data.get("sections", {}):
+                    del data["sections"][section_name]
+                    data["last_modified"] = datetime.now().isoformat()
+
+                    _dump_yaml(file_path, data)
+                    _forget_yaml_cached(file_path)
+                    deleted_any = True
+            except Exception:
+                pass
+        elif _unlink_if_exists(file_path):
+            deleted_any = True
 
     return deleted_any
 
@@ -1691,12 +2110,38 @@ def list_sections_with_nn_intervals(
     Returns:
         List of section names that have NN interval data
     """
+    # The metadata index lists the sections; no need to read their intervals
+    processed_dir = get_processed_dir(data_dir=data_dir, project_path=project_path)
+    try:
+        metadata = _read_participant_file(processed_dir / f"{participant_id}_nn_metadata")
+    except Exception:
+        metadata = None
+    if metadata is not None:
+        return list(metadata.get("sections", {}))
+
+    # Legacy v1.0 format (single YAML)
     data = load_nn_intervals(participant_id, data_dir=data_dir, project_path=project_path)
     if data and "sections" in data:
         return list(data["sections"].keys())
     return []
 
 
+def _nn_summary_entry(section_data: dict[str, Any]) -> dict[str, Any]:
+    """Build the summary entry for one NN section."""
+    # Only count the intervals when no stored count exists
+    if "final_nn_count" in section_data:
+        nn_count = section_data["final_nn_count"]
+    else:
+        nn_count = len(section_data.get("intervals", ()))
+    return {
+        "has_nn": True,
+        "nn_count": nn_count,
+        "correction_method": section_data.get("correction_method", "unknown"),
+        "corrected_at": section_data.get("corrected_at"),
+        "intervals_corrected": section_data.get("intervals_corrected", 0),
+    }
+
+
 def get_nn_intervals_summary(
     participant_id: str,
     data_dir: str | None = None,
@@ -1720,18 +2165,28 @@ def get_nn_intervals_summary(
 
         Returns None if no NN intervals file exists.
     """
-    data = load_nn_intervals(participant_id, data_dir=data_dir, project_path=project_path)
+    # The metadata index repeats each section's summary fields, so the
+    # per-section metadata and interval files are not read
+    processed_dir = get_processed_dir(data_dir=data_dir, project_path=project_path)
+    try:
+        metadata = _read_participant_file(processed_dir / f"{participant_id}_nn_metadata")
+    except Exception:
+        metadata = None
+    if metadata is not None:
+        data = {"sections": {}}
+        for section_name, entry in metadata.get("sections", {}).items():
+            if "final_nn_count" not in entry:
+                # Older entry without a stored count: count the intervals
+                nn_count = _count_nn_intervals(_nn_intervals_stem(processed_dir, participant_id, section_name))
+                entry = {**entry, "final_nn_count": nn_count or 0}
+            data["sections"][section_name] = entry
+    else:
+        # Legacy v1.0 format (single YAML)
+        data = load_nn_intervals(participant_id, data_dir=data_dir, project_path=project_path)
     if not data:
         return None
 
-    summary = {}
-    for section_name, section_data in data.get("sections", {}).items():
-        summary[section_name] = {
-            "has_nn": True,
-            "nn_count": section_data.get("final_nn_count", len(section_data.get("intervals", []))),
-            "correction_method": section_data.get("correction_method", "unknown"),
-            "corrected_at": section_data.get("corrected_at"),
-            "intervals_corrected": section_data.get("intervals_corrected", 0),
-        }
-
-    return summary
+    return {
+        section_name: _nn_summary_entry(section_data)
+        for section_name, section_data in data.get("sections", {}).items()
+    }
@@ -13,6 +13,9 @@ and audit trail.
 
 from __future__ import annotations
 
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
@@ -615,6 +618,26 @@ def get_quigley_recommendation(artifact_rate: float, beat_count: int) -> str:
         return "suitable_for_all_metrics"
 
 
+# Per (participant, search dirs): directory mtimes at scan time, whether those
+# mtimes can be trusted, and the files found; least recently used dropped first
+_FIND_CACHE: OrderedDict[
+    tuple[str, tuple[Path, ...]], tuple[tuple[int | None, ...], bool, list[Path]]
+] = OrderedDict()
+_FIND_CACHE_SIZE = 256
+_FIND_CACHE_LOCK = threading.Lock()  # Streamlit sessions run on separate threads
+# Directories changed this recently may change again within the same mtime
+# tick (FAT/exFAT store 2 s steps), so scans of them are not reused
+_MTIME_SLACK_NS = 2_000_000_000
+
+
+def _dir_mtime_ns(directory: Path) -> int | None:
+    """Return the directory's mtime in ns, or None if it does not exist."""
+    try:
+        return directory.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
 def find_rrational_files(
     participant_id: str,
     data_dir: Path | str | None = None,
@@ -622,6 +645,11 @@ def find_rrational_files(
 ) -> list[Path]:
     """Find all .rrational files for a participant.
 
+    The directory scan is reused until one of the searched directories
+    changes (files added, removed or renamed); directories changed within
+    the last couple of seconds are always rescanned. The result is re-sorted
+    by file mtime on every call.
+
     Args:
         participant_id: The participant to find files for
         data_dir: Optional data directory (checks ../processed/)
@@ -630,33 +658,54 @@ def find_rrational_files(
     Returns:
         List of paths to .rrational files
     """
-    files = []
+    search_dirs = []
 
     # Check project processed folder (highest priority)
     if project_path:
-        project_path = Path(project_path)
-        processed_dir = project_path / "processed"
-        if processed_dir.exists():
-            pattern = f"{participant_id}*.rrational"
-            files.extend(processed_dir.glob(pattern))
+        search_dirs.append(Path(project_path) / "processed")
 
     # Check processed folder relative to data_dir
     if data_dir:
-        data_dir = Path(data_dir)
-        processed_dir = data_dir.parent / "processed"
-        if processed_dir.exists():
-            pattern = f"{participant_id}*.rrational"
-            files.extend(processed_dir.glob(pattern))
+        search_dirs.append(Path(data_dir).parent / "processed")
 
     # Check user config directory
-    config_dir = Path.home() / ".rrational" / "exports"
-    if config_dir.exists():
+    search_dirs.append(Path.home() / ".rrational" / "exports")
+
+    key = (participant_id, tuple(search_dirs))
+    stamps = tuple(_dir_mtime_ns(directory) for directory in search_dirs)
+    with _FIND_CACHE_LOCK:
+        cached = _FIND_CACHE.get(key)
+        if cached is not None and cached[1] and cached[0] == stamps:
+            _FIND_CACHE.move_to_end(key)
+        else:
+            cached = None
+    if cached is None:
+        # Scan outside the lock so other sessions aren't held up
+        scanned_at = time.time_ns()
+        files = []
         pattern = f"{participant_id}*.rrational"
-        files.extend(config_dir.glob(pattern))
-
-    # Deduplicate (same file might be found via different paths)
-    unique_files = list({f.resolve(): f for f in files}.values())
-    return sorted(unique_files, key=lambda p: p.stat().st_mtime, reverse=True)
+        for directory, stamp in zip(search_dirs, stamps):
+            if stamp is not None:
+                files.extend(directory.glob(pattern))
+
+        # Deduplicate (same file might be found via different paths)
+        trusted = all(stamp is None or scanned_at - stamp > _MTIME_SLACK_NS for stamp in stamps)
+        cached = (stamps, trusted, list({f.resolve(): f for f in files}.values()))
+        with _FIND_CACHE_LOCK:
+            _FIND_CACHE[key] = cached
+            _FIND_CACHE.move_to_end(key)
+            if len(_FIND_CACHE) > _FIND_CACHE_SIZE:
+                _FIND_CACHE.popitem(last=False)
+
+    mtimes = {}
+    for path in cached[2]:
+        try:
+            mtimes[path] = path.stat().st_mtime
+        except FileNotFoundError:
+            # Deleted without a visible directory change: rescan next time
+            with _FIND_CACHE_LOCK:
+                _FIND_CACHE.pop(key, None)
+    return sorted(mtimes, key=mtimes.__getitem__, reverse=True)
 
 
 def build_export_filename(participant_id: str, segment_name: str | None = None) -> str:
@@ -1136,10 +1185,14 @@ def build_rrational_v2(
     """Build a v2.0 export by consolidating data from intermediate files.
 
     This function loads data from:
-    - {participant_id}_events.yml (events, exclusion zones)
-    - {participant_id}_artifacts.yml (artifact detection per section)
+    - {participant_id}_events.json (events, exclusion zones)
+    - {participant_id}_artifacts.json (artifact detection per section)
     - {participant_id}_section_validations.yml (validated sections)
-    - {participant_id}_nn_intervals.yml (corrected NN intervals)
+    - {participant_id}_nn_metadata.json plus per-section {participant_id}_{section}_nn.*
+      files (corrected NN intervals)
+
+    Older projects with the .yml versions of the events/artifacts files, or a
+    single {participant_id}_nn_intervals.yml, are still read as a fallback.
 
     Args:
         participant_id: The participant ID
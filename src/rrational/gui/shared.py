@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import re
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -10,6 +13,7 @@ from pathlib import Path
 from typing import Optional
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
 from rrational.cleaning.rr import CleaningConfig
 from rrational.io import DEFAULT_ID_PATTERN, PREDEFINED_PATTERNS, load_recording, discover_recordings
@@ -24,6 +28,7 @@ from rrational.gui.persistence import (
     save_sections,
     save_participants,
     load_participants,
+    flush_participant_events,
 )
 
 # Re-export for convenience
@@ -51,8 +56,13 @@ __all__ = [
     "save_all_config",
     "save_participant_data",
     "update_normalizer",
+    "rename_event_everywhere",
+    "delete_event_everywhere",
     "show_toast",
+    "queue_toast",
+    "flush_toasts",
     "auto_save_config",
+    "flush_config",
     "validate_regex_pattern",
     "extract_section_rr_intervals",
     "filter_exclusion_zones",
@@ -63,6 +73,7 @@ __all__ = [
     "scroll_to_top",
     "get_participant_list",
     "get_summary_dict",
+    "normalize_summaries",
     # Cached functions
     "cached_load_hrv_logger_preview",
     "cached_load_vns_preview",
@@ -95,6 +106,9 @@ def _normalize_timestamp(ts):
     return ts
 
 
+# Quiet period after the last config edit before it is written to disk
+CONFIG_SAVE_DEBOUNCE_S = 0.5
+
 # Default canonical events for the Default Group
 DEFAULT_CANONICAL_EVENTS = {
     "rest_pre_start": [],
@@ -760,12 +774,28 @@ def init_session_state():
 
 def save_all_config():
     """Save all configuration to persistent storage."""
-    project_path = st.session_state.get("current_project")
-    save_groups(st.session_state.groups, project_path)
-    save_events(st.session_state.all_events, project_path)
-    if hasattr(st.session_state, 'sections'):
-        save_sections(st.session_state.sections, project_path)
-    save_participant_data()
+    _write_config(_config_snapshot())
+
+
+def _config_snapshot():
+    """Copy the config held in session state, for writing it later."""
+    return copy.deepcopy({
+        "project_path": st.session_state.get("current_project"),
+        "groups": st.session_state.groups,
+        "all_events": st.session_state.all_events,
+        "sections": st.session_state.sections if hasattr(st.session_state, 'sections') else None,
+        "participants": _participants_data(),
+    })
+
+
+def _write_config(snapshot):
+    """Write a config snapshot from _config_snapshot() to persistent storage."""
+    project_path = snapshot["project_path"]
+    save_groups(snapshot["groups"], project_path)
+    save_events(snapshot["all_events"], project_path)
+    if snapshot["sections"] is not None:
+        save_sections(snapshot["sections"], project_path)
+    save_participants(snapshot["participants"], project_path)
 
 
 def save_participant_data():
@@ -774,7 +804,11 @@ def save_participant_data():
     Note: Section selections are stored separately in {participant_id}_section_validations.yml
     via save_full_section_validations().
     """
-    project_path = st.session_state.get("current_project")
+    save_participants(_participants_data(), st.session_state.get("current_project"))
+
+
+def _participants_data():
+    """Collect the per-participant data saved by save_participant_data()."""
     participants_data = {}
 
     # Collect all participant IDs that have any data
@@ -795,7 +829,7 @@ def save_participant_data():
             "manual_events": st.session_state.manual_events.get(pid, []),
         }
 
-    save_participants(participants_data, project_path)
+    return participants_data
 
 
 def update_normalizer():
@@ -805,6 +839,31 @@ def update_normalizer():
     cached_load_vns_preview.clear()
 
 
+def _renamed_key(mapping, old_name, new_name):
+    """Return a copy of mapping with old_name renamed in place (order kept)."""
+    return {(new_name if key == old_name else key): value for key, value in mapping.items()}
+
+
+def rename_event_everywhere(old_name, new_name):
+    """Rename an event in all_events and every group's expected events.
+
+    The event keeps its position, so Setup lists and the normalizer's
+    canonical order don't shift after a rename.
+    """
+    st.session_state.all_events = _renamed_key(st.session_state.all_events, old_name, new_name)
+    for group_data in st.session_state.groups.values():
+        expected = group_data.get("expected_events")
+        if expected and old_name in expected:
+            group_data["expected_events"] = _renamed_key(expected, old_name, new_name)
+
+
+def delete_event_everywhere(evt_name):
+    """Remove an event from all_events and every group's expected events."""
+    st.session_state.all_events.pop(evt_name, None)
+    for group_data in st.session_state.groups.values():
+        group_data.get("expected_events", {}).pop(evt_name, None)
+
+
 def show_toast(message, icon="success"):
     """Show a toast notification with auto-dismiss."""
     if icon == "success":
@@ -819,14 +878,86 @@ def show_toast(message, icon="success"):
         st.toast(message)
 
 
+def queue_toast(message, icon="success"):
+    """Defer a toast from a widget callback to the next render pass.
+
+    Callbacks of widgets inside a fragment must not emit elements, so they
+    queue their toast here and the fragment shows it via flush_toasts().
+    """
+    st.session_state.setdefault("_pending_toasts", []).append((message, icon))
+
+
+def flush_toasts():
+    """Show and clear the toasts queued by queue_toast()."""
+    for message, icon in st.session_state.pop("_pending_toasts", []):
+        show_toast(message, icon=icon)
+
+
+class _PendingConfigSave:
+    """Config snapshot waiting for its debounced write.
+
+    The snapshot is taken on the script thread, so the timer thread never
+    reads session state while widget callbacks may be changing it.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.snapshot = None
+        self.marked_at = None
+
+
 def auto_save_config():
-    """Auto-save configuration with non-intrusive feedback."""
-    save_all_config()
+    """Auto-save configuration with non-intrusive feedback.
+
+    Bursts of edits (e.g. ticking several events) are coalesced: the write
+    happens once no further edit arrived for CONFIG_SAVE_DEBOUNCE_S.
+    """
     st.session_state.last_save_time = time.time()
+    if get_script_run_ctx() is None:
+        # Outside a Streamlit session there is no one to flush later
+        save_all_config()
+        return
+    pending = st.session_state.setdefault("_pending_config_save", _PendingConfigSave())
+    snapshot = _config_snapshot()
+    marked_at = time.monotonic()
+    with pending.lock:
+        pending.snapshot = snapshot
+        pending.marked_at = marked_at
+    timer = threading.Timer(CONFIG_SAVE_DEBOUNCE_S, _flush_config_if_settled, args=(pending, marked_at))
+    timer.start()
+
+
+def _flush_config_if_settled(pending, marked_at):
+    """Timer target: write the snapshot unless a newer edit superseded it."""
+    with pending.lock:
+        if pending.snapshot is None or pending.marked_at != marked_at:
+            return
+        _write_config(pending.snapshot)
+        pending.snapshot = None
+
+
+def flush_config():
+    """Write pending auto-saved config changes now.
+
+    Called before anything that changes where or whether config is saved
+    (switching project or page), so a pending write never lands elsewhere.
+    """
+    pending = st.session_state.get("_pending_config_save")
+    if pending is not None:
+        with pending.lock:
+            if pending.snapshot is not None:
+                pending.snapshot = None
+                save_all_config()
+    flush_participant_events()
 
 
+@functools.lru_cache(maxsize=128)
 def validate_regex_pattern(pattern):
-    """Validate regex pattern and return error message if invalid."""
+    """Validate regex pattern and return error message if invalid.
+
+    Cached on the pattern string because Streamlit re-validates the same
+    patterns on every rerun.
+    """
     try:
         re.compile(pattern)
         return None
@@ -1449,3 +1580,20 @@ def get_summary_dict():
         st.session_state._summary_dict = {s.participant_id: s for s in summaries}
         st.session_state._summary_dict_cache_key = cache_key
     return st.session_state._summary_dict
+
+
+def normalize_summaries(summaries, source_app):
+    """Backfill summary attributes once, right after loading.
+
+    Summaries restored from an older cache entry may lack fields added later
+    (e.g. ``rr_file_count``), so table code used to ``getattr`` with defaults
+    on every rerun. Normalizing here lets it use plain attribute access.
+    """
+    for s in summaries:
+        if getattr(s, 'source_app', "Unknown") == "Unknown":
+            object.__setattr__(s, 'source_app', source_app)
+        if not hasattr(s, 'rr_file_count'):
+            object.__setattr__(s, 'rr_file_count', 1)
+        if not hasattr(s, 'events_file_count'):
+            object.__setattr__(s, 'events_file_count', 1 if s.events_detected > 0 else 0)
+    return summaries
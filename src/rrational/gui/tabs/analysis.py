@@ -2105,21 +2105,18 @@ def _render_single_participant_analysis():
                         else:
                             st.warning(f"**v2.0 Export** - {total_sections} sections validated, but no NN data saved")
 
-                        # Try to supplement artifact data from _artifacts.yml if missing
+                        # Try to supplement artifact data from _artifacts.json/.yml if missing
                         # This handles old .rrational files that didn't save artifact counts
                         import os
                         participant_id = ready_data_v2.metadata.participant_id
                         artifacts_dir = os.path.dirname(str(selected_ready_file))
-                        artifacts_file = os.path.join(artifacts_dir, f"{participant_id}_artifacts.yml")
                         supplemental_artifacts = {}
-                        if os.path.exists(artifacts_file):
-                            try:
-                                import yaml
-                                with open(artifacts_file, 'r', encoding='utf-8') as f:
-                                    artifacts_data = yaml.safe_load(f) or {}
-                                supplemental_artifacts = artifacts_data.get("sections", {})
-                            except Exception:
-                                pass
+                        try:
+                            from rrational.gui.persistence import load_artifacts_file
+                            artifacts_data = load_artifacts_file(artifacts_dir, participant_id) or {}
+                            supplemental_artifacts = artifacts_data.get("sections", {})
+                        except Exception:
+                            pass
 
                         # Show available sections with quality info
                         section_info = []
@@ -2498,20 +2495,17 @@ def _render_single_participant_analysis():
                             ready_data_v2 = load_rrational_v2(selected_ready_file)
                         progress.progress(10)
 
-                        # Load supplemental artifact data from _artifacts.yml if available
+                        # Load supplemental artifact data from _artifacts.json/.yml if available
                         import os
                         participant_id = ready_data_v2.metadata.participant_id
                         artifacts_dir = os.path.dirname(str(selected_ready_file))
-                        artifacts_file = os.path.join(artifacts_dir, f"{participant_id}_artifacts.yml")
                         supplemental_artifacts = {}
-                        if os.path.exists(artifacts_file):
-                            try:
-                                import yaml
-                                with open(artifacts_file, 'r', encoding='utf-8') as f:
-                                    artifacts_data = yaml.safe_load(f) or {}
-                                supplemental_artifacts = artifacts_data.get("sections", {})
-                            except Exception:
-                                pass
+                        try:
+                            from rrational.gui.persistence import load_artifacts_file
+                            artifacts_data = load_artifacts_file(artifacts_dir, participant_id) or {}
+                            supplemental_artifacts = artifacts_data.get("sections", {})
+                        except Exception:
+                            pass
 
                         section_results = {}
                         total_sections = len(selected_v2_sections)
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import time
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 from rrational.cleaning.rr import CleaningConfig
 from rrational.io import DEFAULT_ID_PATTERN, PREDEFINED_PATTERNS
+from rrational.prep.summaries import PreparationSummary
 from rrational.gui.help_text import CLEANING_THRESHOLDS_HELP, DATA_CORRECTION_WORKFLOW
 from rrational.gui.shared import (
     cached_load_hrv_logger_preview,
@@ -22,6 +25,7 @@ from rrational.gui.shared import (
     show_toast,
     validate_regex_pattern,
     get_quality_badge,
+    normalize_summaries,
 )
 
 
@@ -37,6 +41,12 @@ RECORDING_APP_DETECTION = {
     "elitehrv": {"name": "Elite HRV", "device": "Unknown", "sampling_rate": 1000},
 }
 
+# Participant ID pattern choices for the Import Settings selectbox
+PATTERN_OPTIONS: tuple[str, ...] = (*PREDEFINED_PATTERNS.keys(), "Custom pattern...")
+
+# Seconds cleaning thresholds must stay unchanged before cached previews are cleared
+CLEANING_CONFIG_SETTLE_S = 0.3
+
 
 def analyze_folder_structure(root_path: Path) -> dict:
     """Analyze the folder structure to find data sources.
@@ -141,6 +151,20 @@ def analyze_folder_structure(root_path: Path) -> dict:
     }
 
 
+def _dir_fingerprint(root_path: Path) -> tuple:
+    """Return a cheap change signature for the data files under a folder.
+
+    One (relative path, mtime, size) entry per CSV/TXT file, so a reload can
+    be skipped when nothing on disk changed.
+    """
+    entries = []
+    for path in root_path.rglob("*"):
+        if path.suffix.lower() in (".csv", ".txt") and path.is_file():
+            stat = path.stat()
+            entries.append((str(path.relative_to(root_path)), stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(entries))
+
+
 def detect_recording_app(data_path: Path) -> dict:
     """Detect recording app from folder name in the data path.
 
@@ -169,6 +193,14 @@ def detect_recording_app(data_path: Path) -> dict:
 
 def render_data_tab():
     """Render the Data tab content."""
+    # Debounced cache clear for cleaning threshold edits. The new config is
+    # already a different cache key, so stale previews only need evicting
+    # once after the last change rather than on every step.
+    dirty_at = st.session_state.get("cleaning_config_dirty_at")
+    if dirty_at is not None and time.monotonic() - dirty_at > CLEANING_CONFIG_SETTLE_S:
+        cached_load_hrv_logger_preview.clear()
+        del st.session_state.cleaning_config_dirty_at
+
     st.header("Data Import")
 
     # Quick help section
@@ -209,10 +241,9 @@ def render_data_tab():
             st.markdown("**Participant ID Pattern**")
 
             # Predefined pattern dropdown
-            pattern_options = list(PREDEFINED_PATTERNS.keys()) + ["Custom pattern..."]
             selected_pattern_name = st.selectbox(
                 "Select pattern format",
-                options=pattern_options,
+                options=PATTERN_OPTIONS,
                 index=0,
                 key="pattern_selector",
                 help="Choose a predefined pattern or select 'Custom pattern...' to enter your own",
@@ -241,7 +272,7 @@ def render_data_tab():
             st.markdown("**RR Cleaning Thresholds**")
 
             def update_cleaning_config():
-                """Callback to update cleaning config and clear cache."""
+                """Callback to update cleaning config and schedule a cache clear."""
                 # Convert percentage (0-100) back to decimal (0.0-1.0)
                 sudden_pct = st.session_state.get("sudden_change_input_pct", 100) / 100.0
                 st.session_state.cleaning_config = CleaningConfig(
@@ -249,7 +280,8 @@ def render_data_tab():
                     rr_max_ms=st.session_state.rr_max_input,
                     sudden_change_pct=sudden_pct,
                 )
-                cached_load_hrv_logger_preview.clear()
+                # Cleared once the thresholds settle (see top of render_data_tab)
+                st.session_state.cleaning_config_dirty_at = time.monotonic()
 
             col_rr1, col_rr2 = st.columns(2)
             with col_rr1:
@@ -430,6 +462,7 @@ def render_data_tab():
                         cached_load_vns_preview.clear()
                         cached_load_hrv_logger_preview.clear()
                         st.session_state.pop("summaries", None)
+                        st.session_state.pop("_loader_fp", None)
                         st.rerun()
 
                 if load_clicked:
@@ -442,6 +475,8 @@ def render_data_tab():
                                 "sudden_change_pct": st.session_state.cleaning_config.sudden_change_pct,
                             }
 
+                            loader_fp = st.session_state.setdefault("_loader_fp", {})
+
                             for src in selected_sources:
                                 if src['name'] == "Elite HRV":
                                     st.write(f"Skipping {src['folder']} (Elite HRV not yet supported)")
@@ -450,16 +485,30 @@ def render_data_tab():
                                 st.write(f"Loading from: {src['folder']} ({src['name']})")
                                 load_path = Path(src["path"])
 
+                                # Skip the loader entirely if neither the files on disk nor the
+                                # load settings changed since this folder was last loaded
+                                use_corrected = st.session_state.get("vns_use_corrected", False)
+                                load_key = (
+                                    _dir_fingerprint(load_path),
+                                    id_pattern,
+                                    tuple(config_dict.items()),
+                                    tuple((k, tuple(v)) for k, v in st.session_state.all_events.items()),
+                                    use_corrected if src["name"] == "VNS Analyse" else None,
+                                )
+                                previous_load = loader_fp.get(src["path"])
+                                app_name = "VNS Analyse" if src["name"] == "VNS Analyse" else "HRV Logger"
+
                                 # Use the appropriate loader based on detected app
-                                if src["name"] == "VNS Analyse":
+                                if previous_load is not None and previous_load[0] == load_key:
+                                    summaries = previous_load[1]
+                                elif src["name"] == "VNS Analyse":
                                     summaries = cached_load_vns_preview(
                                         str(load_path),
                                         pattern=id_pattern,
                                         config_dict=config_dict,
                                         gui_events_dict=st.session_state.all_events,
-                                        use_corrected=st.session_state.get("vns_use_corrected", False),
+                                        use_corrected=use_corrected,
                                     )
-                                    app_name = "VNS Analyse"
                                 else:
                                     # Default to HRV Logger format
                                     summaries = cached_load_hrv_logger_preview(
@@ -468,12 +517,10 @@ def render_data_tab():
                                         config_dict=config_dict,
                                         gui_events_dict=st.session_state.all_events,
                                     )
-                                    app_name = "HRV Logger"
+                                loader_fp[src["path"]] = (load_key, summaries)
 
-                                # Ensure source_app is set (handles old cached data)
-                                for s in summaries:
-                                    if not hasattr(s, 'source_app') or s.source_app == "Unknown":
-                                        object.__setattr__(s, 'source_app', app_name)
+                                # Ensure source_app and file counts are set (handles old cached data)
+                                normalize_summaries(summaries, app_name)
 
                                 st.write(f"   Found {len(summaries)} participant(s)")
                                 all_summaries.extend(summaries)
@@ -512,21 +559,56 @@ def render_data_tab():
         # _render_batch_processing()
 
 
-def _build_participants_csv() -> str:
-    """Build CSV string from participants data for download."""
-    loaded_participants = cached_load_participants()
+def _build_participants_csv() -> bytes:
+    """Build CSV bytes from participants data for download.
+
+    Only the raw per-participant fields are collected here; formatting and
+    serialization happen in the cached ``_participants_csv``.
+    """
     rows = []
 
     for summary in st.session_state.summaries:
-        recording_dt_str = ""
-        if summary.recording_datetime:
-            recording_dt_str = summary.recording_datetime.strftime("%Y-%m-%d %H:%M")
+        group_code = st.session_state.participant_groups.get(summary.participant_id, "Default")
 
-        source_app = getattr(summary, 'source_app', 'Unknown')
+        group_data = st.session_state.groups.get(group_code, {})
+        group_label = group_data.get("label", "") if isinstance(group_data, dict) else ""
+        group_display = group_label if group_label else group_code
+
+        rows.append((
+            summary.participant_id,
+            group_display,
+            summary.source_app,
+            summary.rr_file_count,
+            summary.events_file_count,
+            summary.recording_datetime,
+            summary.total_beats,
+            summary.retained_beats,
+            summary.duplicate_rr_intervals,
+            summary.artifact_ratio,
+            summary.duration_s,
+            summary.events_detected,
+            summary.duplicate_events,
+        ))
+
+    device_settings = st.session_state.get("default_device_settings", {})
+    device_name = device_settings.get("device", "Unknown")
+
+    return _participants_csv(tuple(rows), device_name)
+
+
+@st.cache_data(show_spinner=False, ttl=600)
+def _participants_csv(rows: tuple, device_name: str) -> bytes:
+    """Serialize participant rows to CSV, reused across reruns until data changes."""
+    records = []
+
+    for (participant_id, group_display, source_app, rr_count, ev_count, recording_dt,
+         total_beats, retained_beats, duplicate_rr, artifact_ratio, duration_s,
+         events_detected, duplicate_events) in rows:
+        recording_dt_str = ""
+        if recording_dt:
+            recording_dt_str = recording_dt.strftime("%Y-%m-%d %H:%M")
 
         # Format files column based on source app
-        rr_count = getattr(summary, 'rr_file_count', 1)
-        ev_count = getattr(summary, 'events_file_count', 1 if summary.events_detected > 0 else 0)
         if source_app == "VNS Analyse":
             # VNS has single TXT files (not separate RR/Events)
             files_str = f"{rr_count} TXT"
@@ -534,36 +616,130 @@ def _build_participants_csv() -> str:
             # HRV Logger has separate RR and Events CSV files
             files_str = f"{rr_count}RR/{ev_count}Ev"
 
-        group_code = st.session_state.participant_groups.get(summary.participant_id, "Default")
-
-        group_data = st.session_state.groups.get(group_code, {})
-        group_label = group_data.get("label", "") if isinstance(group_data, dict) else ""
-        group_display = group_label if group_label else group_code
-
-        device_settings = st.session_state.get("default_device_settings", {})
-        device_name = device_settings.get("device", "Unknown")
-
-        # VNS data doesn't have duplicate events
-        duplicate_events = 0 if source_app == "VNS Analyse" else summary.duplicate_events
-
-        rows.append({
-            "Participant": summary.participant_id,
+        records.append({
+            "Participant": participant_id,
             "Group": group_display,
             "App": source_app,
             "Device": device_name,
             "Files": files_str,
             "Date/Time": recording_dt_str,
-            "Total Beats": summary.total_beats,
-            "Retained": summary.retained_beats,
-            "Duplicates": summary.duplicate_rr_intervals,
-            "Artifacts (%)": f"{summary.artifact_ratio * 100:.1f}",
-            "Duration (min)": f"{summary.duration_s / 60:.1f}",
-            "Events": summary.events_detected,
-            "Duplicate Events": duplicate_events,
+            "Total Beats": total_beats,
+            "Retained": retained_beats,
+            "Duplicates": duplicate_rr,
+            "Artifacts (%)": f"{artifact_ratio * 100:.1f}",
+            "Duration (min)": f"{duration_s / 60:.1f}",
+            "Events": events_detected,
+            # VNS data doesn't have duplicate events
+            "Duplicate Events": 0 if source_app == "VNS Analyse" else duplicate_events,
         })
 
-    df = pd.DataFrame(rows)
-    return df.to_csv(index=False)
+    df = pd.DataFrame(records)
+    return df.to_csv(index=False).encode("utf-8")
+
+
+def _summary_cache_key(summary: PreparationSummary) -> tuple:
+    """Hash a summary by the fields the participants table shows."""
+    return (
+        summary.participant_id,
+        summary.source_app,
+        summary.rr_file_count,
+        summary.events_file_count,
+        summary.recording_datetime,
+        summary.total_beats,
+        summary.retained_beats,
+        summary.duplicate_rr_intervals,
+        summary.artifact_ratio,
+        summary.duration_s,
+        summary.events_detected,
+        summary.duplicate_events,
+        summary.rr_min_ms,
+        summary.rr_max_ms,
+        summary.rr_mean_ms,
+    )
+
+
+@st.cache_data(show_spinner=False, ttl=600, hash_funcs={PreparationSummary: _summary_cache_key})
+def _build_participants_df(summaries, participant_groups, groups, loaded_participants, device_name):
+    """Build the participants overview DataFrame column-wise.
+
+    Fills one preallocated array per column, then hands pandas the whole
+    dict. Cached so reruns with unchanged summaries/groups skip the build.
+    """
+    n = len(summaries)
+
+    participant_ids = [""] * n
+    csv_status = [""] * n
+    quality_badges = [""] * n
+    saved = [""] * n
+    source_apps = [""] * n
+    files = [""] * n
+    recording_dts = [""] * n
+    group_displays = [""] * n
+    artifacts_pct = [""] * n
+    durations_min = [""] * n
+    rr_ranges = [""] * n
+    rr_means = [""] * n
+    total_beats = np.empty(n, dtype=np.int64)
+    retained_beats = np.empty(n, dtype=np.int64)
+    duplicate_rr = np.empty(n, dtype=np.int64)
+    events_detected = np.empty(n, dtype=np.int64)
+    duplicate_events = np.empty(n, dtype=np.int64)
+
+    for i, summary in enumerate(summaries):
+        # Formatted columns that only depend on the summary are cached on it
+        row = summary.table_row
+        participant_ids[i] = summary.participant_id
+        source_apps[i] = summary.source_app
+        files[i] = row["Files"]
+        recording_dts[i] = row["Date/Time"]
+        artifacts_pct[i] = row["Artifacts (%)"]
+        durations_min[i] = row["Duration (min)"]
+        rr_ranges[i] = row["RR Range (ms)"]
+        rr_means[i] = row["Mean RR (ms)"]
+
+        quality_badges[i] = get_quality_badge(100, summary.artifact_ratio)
+
+        # Get group assignment
+        group_code = participant_groups.get(summary.participant_id, "Default")
+
+        # Get group label for display (show only label if defined, otherwise code)
+        group_data = groups.get(group_code, {})
+        group_label = group_data.get("label", "") if isinstance(group_data, dict) else ""
+        group_displays[i] = group_label if group_label else group_code
+
+        # Check if participant has group assigned
+        csv_status[i] = "G" if group_code != "Default" else "—"
+        saved[i] = "Y" if summary.participant_id in loaded_participants else "N"
+
+        total_beats[i] = summary.total_beats
+        retained_beats[i] = summary.retained_beats
+        duplicate_rr[i] = summary.duplicate_rr_intervals
+        events_detected[i] = summary.events_detected
+        duplicate_events[i] = row["Duplicate Events"]
+
+    participants_columns = {
+        "Participant": participant_ids,
+        "CSV": csv_status,
+        "Quality": quality_badges,
+        "Saved": saved,
+        "App": source_apps,
+        "Device": [device_name] * n,
+        "Files": files,
+        "Date/Time": recording_dts,
+        "Group": group_displays,
+        "Total Beats": total_beats,
+        "Retained": retained_beats,
+        "Duplicates": duplicate_rr,
+        "Artifacts (%)": artifacts_pct,
+        "Duration (min)": durations_min,
+        "Events": events_detected,
+        "Total Events": events_detected + duplicate_events,
+        "Duplicate Events": duplicate_events,
+        "RR Range (ms)": rr_ranges,
+        "Mean RR (ms)": rr_means,
+    }
+
+    return pd.DataFrame(participants_columns)
 
 
 @st.fragment
@@ -588,76 +764,14 @@ def _render_participants_data_editor(group_display_options, group_label_to_code)
 
     if need_rebuild:
         # Build dataframe from current session state
-        participants_data = []
-        loaded_participants = cached_load_participants()
-
-        for summary in st.session_state.summaries:
-            recording_dt_str = ""
-            if summary.recording_datetime:
-                recording_dt_str = summary.recording_datetime.strftime("%Y-%m-%d %H:%M")
-
-            # Show file counts - format based on source app
-            source_app = getattr(summary, 'source_app', 'Unknown')
-            rr_count = getattr(summary, 'rr_file_count', 1)
-            ev_count = getattr(summary, 'events_file_count', 1 if summary.events_detected > 0 else 0)
-            if source_app == "VNS Analyse":
-                # VNS has single TXT files (not separate RR/Events)
-                files_str = f"{rr_count} TXT"
-                if rr_count > 1:
-                    files_str = f"* {files_str}"
-            else:
-                # HRV Logger has separate RR and Events CSV files
-                files_str = f"{rr_count}RR/{ev_count}Ev"
-                if rr_count > 1 or ev_count > 1:
-                    files_str = f"* {files_str}"
-
-            quality_badge = get_quality_badge(100, summary.artifact_ratio)
-
-            # Get device info from session state
-            device_settings = st.session_state.get("default_device_settings", {})
-            device_name = device_settings.get("device", "Unknown")
-
-            # Get group assignment
-            group_code = st.session_state.participant_groups.get(summary.participant_id, "Default")
-
-            # Get group label for display (show only label if defined, otherwise code)
-            group_data = st.session_state.groups.get(group_code, {})
-            group_label = group_data.get("label", "") if isinstance(group_data, dict) else ""
-            group_display = group_label if group_label else group_code
-
-            # Get source app
-            source_app = getattr(summary, 'source_app', 'Unknown')
-
-            # Check if participant has group assigned
-            has_group_assigned = group_code != "Default"
-            csv_status = "G" if has_group_assigned else "—"
-
-            # VNS data doesn't have duplicate events (only if same file loaded twice)
-            duplicate_events = 0 if source_app == "VNS Analyse" else summary.duplicate_events
-
-            participants_data.append({
-                "Participant": summary.participant_id,
-                "CSV": csv_status,
-                "Quality": quality_badge,
-                "Saved": "Y" if summary.participant_id in loaded_participants else "N",
-                "App": source_app,
-                "Device": device_name,
-                "Files": files_str,
-                "Date/Time": recording_dt_str,
-                "Group": group_display,
-                "Total Beats": summary.total_beats,
-                "Retained": summary.retained_beats,
-                "Duplicates": summary.duplicate_rr_intervals,
-                "Artifacts (%)": f"{summary.artifact_ratio * 100:.1f}",
-                "Duration (min)": f"{summary.duration_s / 60:.1f}",
-                "Events": summary.events_detected,
-                "Total Events": summary.events_detected + duplicate_events,
-                "Duplicate Events": duplicate_events,
-                "RR Range (ms)": f"{int(summary.rr_min_ms)}-{int(summary.rr_max_ms)}",
-                "Mean RR (ms)": f"{summary.rr_mean_ms:.0f}",
-            })
-
-        st.session_state._participants_df = pd.DataFrame(participants_data)
+        device_settings = st.session_state.get("default_device_settings", {})
+        st.session_state._participants_df = _build_participants_df(
+            st.session_state.summaries,
+            st.session_state.participant_groups,
+            st.session_state.groups,
+            frozenset(cached_load_participants()),
+            device_settings.get("device", "Unknown"),
+        )
         st.session_state._participants_df_key = summaries_key
 
     df_participants = st.session_state._participants_df
@@ -695,20 +809,16 @@ def _render_participants_data_editor(group_display_options, group_label_to_code)
     )
 
     # Auto-save group assignments when changed
-    groups_changed = False
-
-    for idx, row in edited_df.iterrows():
-        participant_id = row["Participant"]
-
-        # Check group change - convert label to code using mapping
-        new_group_label = row["Group"]
-        new_group_code = group_label_to_code.get(new_group_label, new_group_label)
-        old_group_code = st.session_state.participant_groups.get(participant_id)
-        if old_group_code != new_group_code:
-            st.session_state.participant_groups[participant_id] = new_group_code
-            groups_changed = True
-
-    if groups_changed:
+    # Compare whole columns at once - convert labels to codes using mapping
+    participant_ids = edited_df["Participant"]
+    new_group_codes = edited_df["Group"].map(group_label_to_code).fillna(edited_df["Group"])
+    old_group_codes = participant_ids.map(st.session_state.participant_groups)
+    changed_mask = (new_group_codes != old_group_codes).to_numpy()
+
+    if changed_mask.any():
+        st.session_state.participant_groups.update(
+            zip(participant_ids[changed_mask], new_group_codes[changed_mask])
+        )
         save_participant_data()
         show_toast("Groups saved", icon="success")
 
@@ -719,28 +829,46 @@ def _render_participants_table():
 
     # Smart status summary - only show issues if they exist
     issues = []
-    total_participants = len(st.session_state.summaries)
+    summaries = st.session_state.summaries
+    total_participants = len(summaries)
+
+    # Pull every field the checks need in a single pass, then test each
+    # condition as a vectorized mask instead of re-scanning the summaries
+    issue_fields = np.array(
+        [
+            (
+                s.artifact_ratio,
+                s.duplicate_rr_intervals,
+                s.rr_file_count,
+                s.events_file_count,
+                s.events_detected,
+            )
+            for s in summaries
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 5)
+    artifact_ratio, duplicate_rr, rr_file_count, events_file_count, events_detected = issue_fields.T
 
     # Check for high artifact rates
-    high_artifact = [s for s in st.session_state.summaries if s.artifact_ratio > 0.15]
-    if high_artifact:
-        issues.append(f"**{len(high_artifact)}** participant(s) with high artifact rates (>15%)")
+    n_high_artifact = int(np.count_nonzero(artifact_ratio > 0.15))
+    if n_high_artifact:
+        issues.append(f"**{n_high_artifact}** participant(s) with high artifact rates (>15%)")
 
     # Check for duplicates
-    with_duplicates = [s for s in st.session_state.summaries if s.duplicate_rr_intervals > 0]
-    if with_duplicates:
-        issues.append(f"**{len(with_duplicates)}** participant(s) with duplicate RR intervals")
+    duplicate_mask = duplicate_rr > 0
+    n_with_duplicates = int(np.count_nonzero(duplicate_mask))
+    if n_with_duplicates:
+        issues.append(f"**{n_with_duplicates}** participant(s) with duplicate RR intervals")
 
     # Check for multiple files
-    with_multi_files = [s for s in st.session_state.summaries
-                       if getattr(s, 'rr_file_count', 1) > 1 or getattr(s, 'events_file_count', 0) > 1]
-    if with_multi_files:
-        issues.append(f"**{len(with_multi_files)}** participant(s) with multiple files (merged)")
+    n_with_multi_files = int(np.count_nonzero((rr_file_count > 1) | (events_file_count > 1)))
+    if n_with_multi_files:
+        issues.append(f"**{n_with_multi_files}** participant(s) with multiple files (merged)")
 
     # Check for missing events
-    no_events = [s for s in st.session_state.summaries if s.events_detected == 0]
-    if no_events:
-        issues.append(f"**{len(no_events)}** participant(s) with no events detected")
+    n_no_events = int(np.count_nonzero(events_detected == 0))
+    if n_no_events:
+        issues.append(f"**{n_no_events}** participant(s) with no events detected")
 
     # Display status summary
     if issues:
@@ -764,11 +892,10 @@ def _render_participants_table():
     # Render the editable table as a fragment to prevent resets during consecutive edits
     _render_participants_data_editor(group_display_options, group_label_to_code)
 
-    # Show warning if any participant has duplicate RR intervals (use session state directly)
+    # Show warning if any participant has duplicate RR intervals (reuse the issues scan mask)
     high_duplicates = [
-        (s.participant_id, s.duplicate_rr_intervals)
-        for s in st.session_state.summaries
-        if s.duplicate_rr_intervals > 0
+        (summaries[i].participant_id, int(duplicate_rr[i]))
+        for i in np.flatnonzero(duplicate_mask)
     ]
     if high_duplicates:
         st.warning(
@@ -6,6 +6,10 @@ organized tab with nested sub-tabs.
 
 from __future__ import annotations
 
+import functools
+import itertools
+from collections import Counter
+
 import pandas as pd
 import streamlit as st
 
@@ -17,14 +21,27 @@ from rrational.gui.persistence import (
 )
 from rrational.gui.shared import (
     auto_save_config,
-    show_toast,
+    delete_event_everywhere,
+    flush_toasts,
+    queue_toast,
+    rename_event_everywhere,
     update_normalizer,
     validate_regex_pattern,
 )
 
 
+def _group_events_csv(events_rows: tuple[tuple[str, str], ...]) -> str:
+    """Build a group's expected-events CSV; only runs when Download is clicked."""
+    return pd.DataFrame(events_rows, columns=["Event Name", "Synonyms"]).to_csv(index=False)
+
+
 def render_setup_tab():
-    """Render the Setup tab with nested sub-tabs for Events, Groups, Playlists, Sections."""
+    """Render the Setup tab with nested sub-tabs for Events, Groups, Playlists, Sections.
+
+    Each sub-section is a fragment, so edits inside it rerun only that
+    sub-section. Switching sub-tabs or pages still reruns the full script,
+    which is when other pages pick up the updated session state.
+    """
     st.header("Setup")
 
     # Use radio buttons instead of tabs to properly persist selection state
@@ -71,8 +88,100 @@ def render_setup_tab():
         )
 
 
+# Widget callbacks live at module level and get their target via args=,
+# so rendering doesn't create new closures per event/group/playlist.
+
+def _create_event():
+    """Callback to create new event."""
+    event_name = st.session_state.get("new_event_name_global", "").strip()
+    synonyms_raw = st.session_state.get("new_event_synonyms_global", "")
+
+    synonym_lines = [s.strip() for s in synonyms_raw.split("\n") if s.strip()]
+    invalid = next((line for line in synonym_lines if validate_regex_pattern(line) is not None), None)
+
+    if event_name and event_name not in st.session_state.all_events and invalid is not None:
+        # Keep the inputs so the pattern can be fixed
+        queue_toast(f"Invalid regex '{invalid}', event not created", icon="error")
+    elif event_name and event_name not in st.session_state.all_events:
+        synonyms_list = [line.lower() for line in synonym_lines]
+        st.session_state.all_events[event_name] = synonyms_list
+        auto_save_config()
+        update_normalizer()
+        queue_toast(f"Created event '{event_name}'", icon="success")
+        # Clear the input fields after successful creation
+        st.session_state.new_event_name_global = ""
+        st.session_state.new_event_synonyms_global = ""
+    elif event_name in st.session_state.all_events:
+        queue_toast(f"Event '{event_name}' already exists", icon="error")
+    else:
+        queue_toast("Please enter an event name", icon="error")
+
+
+def _rename_event(old_name: str):
+    """Callback to rename event - reads new name from session_state."""
+    new_name = st.session_state.get(f"edit_event_name_{old_name}", old_name)
+    if new_name != old_name and new_name not in st.session_state.all_events:
+        rename_event_everywhere(old_name, new_name)
+        auto_save_config()
+        update_normalizer()
+        queue_toast(f"Renamed to '{new_name}'", icon="success")
+    elif new_name == old_name:
+        queue_toast("Name unchanged", icon="info")
+    else:
+        queue_toast(f"Event '{new_name}' already exists", icon="error")
+
+
+def _delete_synonym(evt_name: str, idx: int):
+    """Callback to delete synonym."""
+    if evt_name not in st.session_state.all_events:
+        return  # Event already deleted
+    syn_list = st.session_state.all_events[evt_name]
+    if idx < len(syn_list):
+        syn_list.pop(idx)
+        st.session_state.all_events[evt_name] = syn_list
+        auto_save_config()
+        update_normalizer()
+        queue_toast("Synonym deleted", icon="success")
+
+
+def _add_synonym(evt_name: str):
+    """Callback to add synonym - reads new synonym from session_state."""
+    if evt_name not in st.session_state.all_events:
+        return  # Event already deleted
+    new_syn = st.session_state.get(f"new_syn_{evt_name}", "")
+    synonym_lower = new_syn.strip().lower()
+    syn_list = st.session_state.all_events[evt_name]
+    if synonym_lower and validate_regex_pattern(new_syn.strip()) is not None:
+        queue_toast("Invalid regex, synonym not added", icon="error")
+    elif synonym_lower and synonym_lower not in syn_list:
+        syn_list.append(synonym_lower)
+        st.session_state.all_events[evt_name] = syn_list
+        auto_save_config()
+        update_normalizer()
+        queue_toast(f"Added '{synonym_lower}'", icon="success")
+        # Clear input
+        st.session_state[f"new_syn_{evt_name}"] = ""
+    elif synonym_lower in syn_list:
+        queue_toast("Synonym already exists", icon="warning")
+    else:
+        queue_toast("Please enter a synonym", icon="error")
+
+
+def _delete_event(evt_name: str):
+    """Callback to delete event."""
+    if evt_name not in st.session_state.all_events:
+        queue_toast(f"Event '{evt_name}' already deleted", icon="info")
+        return  # Already deleted
+    delete_event_everywhere(evt_name)
+    auto_save_config()
+    update_normalizer()
+    queue_toast(f"Deleted event '{evt_name}'", icon="success")
+
+
+@st.fragment
 def _render_events_section():
     """Render the Events sub-section."""
+    flush_toasts()
     st.subheader("Event Mapping")
 
     with st.expander("Help - Event Mapping", expanded=False):
@@ -103,52 +212,34 @@ def _render_events_section():
 
     # Create new event
     with st.expander("Create New Event"):
-        new_event_name = st.text_input("Event Name (canonical)", key="new_event_name_global")
-        new_event_synonyms = st.text_area(
-            "Synonyms (one per line, regex patterns supported)",
-            key="new_event_synonyms_global",
-            help="Enter regex patterns, one per line. All matching is lowercase. Example: ruhe[ _-]?pre[ _-]?start"
-        )
+        # A form so typing doesn't rerun the section; checks below run on submit
+        with st.form("create_event_form"):
+            new_event_name = st.text_input("Event Name (canonical)", key="new_event_name_global")
+            new_event_synonyms = st.text_area(
+                "Synonyms (one per line, regex patterns supported)",
+                key="new_event_synonyms_global",
+                help="Enter regex patterns, one per line. All matching is lowercase. Example: ruhe[ _-]?pre[ _-]?start"
+            )
 
-        # Real-time validation of event name
-        if new_event_name:
-            if new_event_name in st.session_state.all_events:
-                st.warning(f"Event '{new_event_name}' already exists")
-            elif not new_event_name.replace("_", "").isalnum():
-                st.warning("Event name should be alphanumeric with underscores")
-
-        # Validate synonyms as regex patterns
-        if new_event_synonyms:
-            invalid_patterns = []
-            for line in new_event_synonyms.split("\n"):
-                if line.strip():
-                    error = validate_regex_pattern(line.strip())
-                    if error:
-                        invalid_patterns.append(f"'{line.strip()}': {error}")
-            if invalid_patterns:
-                st.error("Invalid regex patterns:\n" + "\n".join(invalid_patterns))
-
-        def create_event():
-            """Callback to create new event."""
-            # Read from session state to avoid stale closure variables
-            event_name = st.session_state.get("new_event_name_global", "").strip()
-            synonyms_raw = st.session_state.get("new_event_synonyms_global", "")
-
-            if event_name and event_name not in st.session_state.all_events:
-                synonyms_list = [s.strip().lower() for s in synonyms_raw.split("\n") if s.strip()]
-                st.session_state.all_events[event_name] = synonyms_list
-                auto_save_config()
-                update_normalizer()
-                show_toast(f"Created event '{event_name}'", icon="success")
-                # Clear the input fields after successful creation
-                st.session_state.new_event_name_global = ""
-                st.session_state.new_event_synonyms_global = ""
-            elif event_name in st.session_state.all_events:
-                show_toast(f"Event '{event_name}' already exists", icon="error")
-            else:
-                show_toast("Please enter an event name", icon="error")
+            # Validate the submitted event name
+            if new_event_name:
+                if new_event_name in st.session_state.all_events:
+                    st.warning(f"Event '{new_event_name}' already exists")
+                elif not new_event_name.replace("_", "").isalnum():
+                    st.warning("Event name should be alphanumeric with underscores")
+
+            # Validate synonyms as regex patterns
+            if new_event_synonyms:
+                invalid_patterns = []
+                for line in new_event_synonyms.split("\n"):
+                    if line.strip():
+                        error = validate_regex_pattern(line.strip())
+                        if error:
+                            invalid_patterns.append(f"'{line.strip()}': {error}")
+                if invalid_patterns:
+                    st.error("Invalid regex patterns:\n" + "\n".join(invalid_patterns))
 
-        st.button("Create Event", key="create_event_btn_global", on_click=create_event, type="primary")
+            st.form_submit_button("Create Event", key="create_event_btn_global", on_click=_create_event, type="primary")
 
     st.markdown("---")
 
@@ -156,76 +247,14 @@ def _render_events_section():
     st.subheader("All Available Events")
     st.info(f"**{len(st.session_state.all_events)} event(s) defined**")
 
-    # Define callbacks outside loop for better performance
-    def _rename_event(old_name: str):
-        """Callback to rename event - reads new name from session_state."""
-        new_name = st.session_state.get(f"edit_event_name_{old_name}", old_name)
-        if new_name != old_name and new_name not in st.session_state.all_events:
-            st.session_state.all_events[new_name] = st.session_state.all_events.pop(old_name)
-            for group_data in st.session_state.groups.values():
-                if old_name in group_data.get("expected_events", {}):
-                    group_data["expected_events"][new_name] = group_data["expected_events"].pop(old_name)
-            auto_save_config()
-            update_normalizer()
-            show_toast(f"Renamed to '{new_name}'", icon="success")
-        elif new_name == old_name:
-            show_toast("Name unchanged", icon="info")
-        else:
-            show_toast(f"Event '{new_name}' already exists", icon="error")
-
-    def _delete_synonym(evt_name: str, idx: int):
-        """Callback to delete synonym."""
-        if evt_name not in st.session_state.all_events:
-            return  # Event already deleted
-        syn_list = st.session_state.all_events[evt_name]
-        if idx < len(syn_list):
-            syn_list.pop(idx)
-            st.session_state.all_events[evt_name] = syn_list
-            for group_data in st.session_state.groups.values():
-                if evt_name in group_data.get("expected_events", {}):
-                    group_data["expected_events"][evt_name] = syn_list.copy()
-            auto_save_config()
-            update_normalizer()
-            show_toast("Synonym deleted", icon="success")
-
-    def _add_synonym(evt_name: str):
-        """Callback to add synonym - reads new synonym from session_state."""
-        if evt_name not in st.session_state.all_events:
-            return  # Event already deleted
-        new_syn = st.session_state.get(f"new_syn_{evt_name}", "")
-        synonym_lower = new_syn.strip().lower()
-        syn_list = st.session_state.all_events[evt_name]
-        if synonym_lower and synonym_lower not in syn_list:
-            syn_list.append(synonym_lower)
-            st.session_state.all_events[evt_name] = syn_list
-            for group_data in st.session_state.groups.values():
-                if evt_name in group_data.get("expected_events", {}):
-                    group_data["expected_events"][evt_name] = syn_list.copy()
-            auto_save_config()
-            update_normalizer()
-            show_toast(f"Added '{synonym_lower}'", icon="success")
-            # Clear input
-            st.session_state[f"new_syn_{evt_name}"] = ""
-        elif synonym_lower in syn_list:
-            show_toast("Synonym already exists", icon="warning")
-        else:
-            show_toast("Please enter a synonym", icon="error")
-
-    def _delete_event(evt_name: str):
-        """Callback to delete event."""
-        if evt_name not in st.session_state.all_events:
-            show_toast(f"Event '{evt_name}' already deleted", icon="info")
-            return  # Already deleted
-        del st.session_state.all_events[evt_name]
-        for group_data in st.session_state.groups.values():
-            if evt_name in group_data.get("expected_events", {}):
-                del group_data["expected_events"][evt_name]
-        auto_save_config()
-        update_normalizer()
-        show_toast(f"Deleted event '{evt_name}'", icon="success")
+    # Reverse index so each event expander doesn't rescan every group
+    event_to_groups: dict[str, list[str]] = {}
+    for gname, gdata in st.session_state.groups.items():
+        for evt in gdata.get("expected_events", {}):
+            event_to_groups.setdefault(evt, []).append(gname)
 
     if st.session_state.all_events:
-        for event_name, synonyms in list(st.session_state.all_events.items()):
+        for event_name, synonyms in st.session_state.all_events.items():
             with st.expander(f"Event: {event_name} ({len(synonyms)} synonym(s))", expanded=False):
                 # Editable event name
                 col1, col2 = st.columns([3, 1])
@@ -257,10 +286,7 @@ def _render_events_section():
                     )
 
                 # Show used in groups
-                used_in_groups = [
-                    gname for gname, gdata in st.session_state.groups.items()
-                    if event_name in gdata.get("expected_events", {})
-                ]
+                used_in_groups = event_to_groups.get(event_name, [])
                 if used_in_groups:
                     st.info(f"Used in groups: {', '.join(used_in_groups)}")
                 else:
@@ -288,32 +314,32 @@ def _render_events_section():
 
                 # Add new synonym
                 st.markdown("**Add New Synonym:**")
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    new_synonym = st.text_input(
-                        "New synonym (regex pattern)",
-                        key=f"new_syn_{event_name}",
-                        placeholder="e.g., rest[ _-]?start"
-                    )
-
-                    if new_synonym:
-                        error = validate_regex_pattern(new_synonym.strip())
-                        if error:
-                            st.error(f"Invalid regex: {error}")
-                        elif new_synonym.strip().lower() in synonyms:
-                            st.warning("This synonym already exists")
-
-                with col2:
-                    st.write("")
-                    st.write("")
-                    st.button(
-                        "Add",
-                        key=f"add_syn_btn_{event_name}",
-                        on_click=_add_synonym,
-                        args=(event_name,),
-                        type="primary",
-                        disabled=not new_synonym or validate_regex_pattern(new_synonym.strip()) is not None,
-                    )
+                with st.form(f"add_syn_form_{event_name}", border=False):
+                    col1, col2 = st.columns([3, 1])
+                    with col1:
+                        new_synonym = st.text_input(
+                            "New synonym (regex pattern)",
+                            key=f"new_syn_{event_name}",
+                            placeholder="e.g., rest[ _-]?start"
+                        )
+
+                        if new_synonym:
+                            error = validate_regex_pattern(new_synonym.strip())
+                            if error:
+                                st.error(f"Invalid regex: {error}")
+                            elif new_synonym.strip().lower() in synonyms:
+                                st.warning("This synonym already exists")
+
+                    with col2:
+                        st.write("")
+                        st.write("")
+                        st.form_submit_button(
+                            "Add",
+                            key=f"add_syn_btn_{event_name}",
+                            on_click=_add_synonym,
+                            args=(event_name,),
+                            type="primary",
+                        )
 
                 # Delete event
                 st.markdown("---")
@@ -329,8 +355,83 @@ def _render_events_section():
         st.info("No events defined yet. Create events above.")
 
 
+def _create_group():
+    """Callback to create new group."""
+    new_group_name = st.session_state.get("new_group_name", "")
+    new_group_label = st.session_state.get("new_group_label", "")
+    if new_group_name and new_group_name not in st.session_state.groups:
+        st.session_state.groups[new_group_name] = {
+            "label": new_group_label or new_group_name,
+            "expected_events": {},
+            "selected_sections": []
+        }
+        auto_save_config()
+        queue_toast(f"Created group '{new_group_name}'", icon="success")
+    elif new_group_name in st.session_state.groups:
+        queue_toast(f"Group '{new_group_name}' already exists", icon="error")
+    else:
+        queue_toast("Please enter a group name", icon="error")
+
+
+def _sync_expected_events(grp_name):
+    """Callback to apply the expected-events multiselect to the group."""
+    all_events = st.session_state.all_events
+    exp_events = st.session_state.groups[grp_name].setdefault("expected_events", {})
+    selected = st.session_state[f"events_ms_{grp_name}"]
+    # Events not defined in Event Mapping can't be shown, so leave them alone
+    removed = [e for e in exp_events if e in all_events and e not in selected]
+    added = [e for e in selected if e not in exp_events]
+    for evt_name in removed:
+        del exp_events[evt_name]
+    for evt_name in added:
+        # Synonyms are looked up in all_events; groups only track the names
+        exp_events[evt_name] = []
+    auto_save_config()
+    for evt_name in added:
+        queue_toast(f"Added '{evt_name}' to {grp_name}", icon="success")
+    for evt_name in removed:
+        queue_toast(f"Removed '{evt_name}' from {grp_name}", icon="info")
+
+
+def _save_group_changes(old_name):
+    """Callback to save group changes."""
+    new_name_val = st.session_state.get(f"edit_group_name_{old_name}", old_name)
+    new_label_val = st.session_state.get(f"edit_group_label_{old_name}", old_name)
+
+    current_name = old_name
+    if new_name_val != old_name:
+        st.session_state.groups[new_name_val] = st.session_state.groups.pop(old_name)
+        for pid, gname in st.session_state.participant_groups.items():
+            if gname == old_name:
+                st.session_state.participant_groups[pid] = new_name_val
+        current_name = new_name_val
+
+    st.session_state.groups[current_name]["label"] = new_label_val
+    auto_save_config()
+    queue_toast(f"Saved changes to '{current_name}'", icon="success")
+
+
+def _update_group_sections(grp_name):
+    """Callback to update sections selection."""
+    st.session_state.groups[grp_name]["selected_sections"] = st.session_state[f"sections_select_{grp_name}"]
+    auto_save_config()
+    queue_toast(f"Sections updated for {grp_name}", icon="success")
+
+
+def _delete_group(grp_name):
+    """Callback to delete group."""
+    for pid, gname in st.session_state.participant_groups.items():
+        if gname == grp_name:
+            st.session_state.participant_groups[pid] = "Default"
+    del st.session_state.groups[grp_name]
+    auto_save_config()
+    queue_toast(f"Deleted group '{grp_name}' and reassigned participants to Default", icon="success")
+
+
+@st.fragment
 def _render_groups_section():
     """Render the Groups sub-section."""
+    flush_toasts()
     st.subheader("Group Management")
 
     with st.expander("Help - Groups & Playlists", expanded=False):
@@ -360,7 +461,7 @@ def _render_groups_section():
     # Create new group
     with st.expander("Create New Group"):
         new_group_name = st.text_input("Group Name (internal ID)", key="new_group_name")
-        new_group_label = st.text_input("Group Label (display name)", key="new_group_label")
+        st.text_input("Group Label (display name)", key="new_group_label")
 
         if new_group_name:
             if new_group_name in st.session_state.groups:
@@ -368,94 +469,71 @@ def _render_groups_section():
             elif not new_group_name.replace("_", "").replace("-", "").isalnum():
                 st.warning("Group name should be alphanumeric with underscores/hyphens")
 
-        def create_group():
-            """Callback to create new group."""
-            if new_group_name and new_group_name not in st.session_state.groups:
-                st.session_state.groups[new_group_name] = {
-                    "label": new_group_label or new_group_name,
-                    "expected_events": {},
-                    "selected_sections": []
-                }
-                auto_save_config()
-                show_toast(f"Created group '{new_group_name}'", icon="success")
-            elif new_group_name in st.session_state.groups:
-                show_toast(f"Group '{new_group_name}' already exists", icon="error")
-            else:
-                show_toast("Please enter a group name", icon="error")
-
-        st.button("Create Group", key="create_group_btn", on_click=create_group, type="primary")
+        st.button("Create Group", key="create_group_btn", on_click=_create_group, type="primary")
 
     st.markdown("---")
 
     # Manage existing groups
     st.subheader("Existing Groups")
 
-    for group_name, group_data in list(st.session_state.groups.items()):
+    participant_counts = Counter(st.session_state.participant_groups.values())
+    available_sections = list(st.session_state.sections.keys()) if hasattr(st.session_state, 'sections') else []
+    available_event_names = list(st.session_state.all_events.keys())
+
+    @functools.cache
+    def synonym_preview(evt_name):
+        """First three synonyms as plain text and as markdown, shared by all groups."""
+        synonyms = st.session_state.all_events.get(evt_name, [])
+        if not synonyms:
+            return "No synonyms", "*No synonyms*"
+        more = "..." if len(synonyms) > 3 else ""
+        # Synonyms are regexes, so show them as code to keep markdown out of them
+        return (
+            ", ".join(itertools.islice(synonyms, 3)) + more,
+            ", ".join(f"`{syn}`" for syn in itertools.islice(synonyms, 3)) + more,
+        )
+
+    for group_name, group_data in st.session_state.groups.items():
         with st.expander(f"{group_name} - {group_data['label']}", expanded=(group_name == "Default")):
 
             st.markdown("**Edit Group:**")
             col1, col2 = st.columns(2)
             with col1:
-                new_name = st.text_input(
+                st.text_input(
                     "Group Name (ID)",
                     value=group_name,
                     key=f"edit_group_name_{group_name}"
                 )
             with col2:
-                new_label = st.text_input(
+                st.text_input(
                     "Group Label",
                     value=group_data["label"],
                     key=f"edit_group_label_{group_name}"
                 )
 
-            def save_group_changes(old_name):
-                """Callback to save group changes."""
-                # Read from session_state to avoid stale closure variables
-                new_name_val = st.session_state.get(f"edit_group_name_{old_name}", old_name)
-                new_label_val = st.session_state.get(f"edit_group_label_{old_name}", old_name)
-
-                current_name = old_name
-                if new_name_val != old_name:
-                    st.session_state.groups[new_name_val] = st.session_state.groups.pop(old_name)
-                    for pid, gname in st.session_state.participant_groups.items():
-                        if gname == old_name:
-                            st.session_state.participant_groups[pid] = new_name_val
-                    current_name = new_name_val
-
-                st.session_state.groups[current_name]["label"] = new_label_val
-                auto_save_config()
-                show_toast(f"Saved changes to '{current_name}'", icon="success")
-
             st.button(
                 f"Save Changes to {group_name}",
                 key=f"save_group_{group_name}",
-                on_click=save_group_changes,
+                on_click=_save_group_changes,
                 args=(group_name,),
                 type="primary",
             )
 
             st.markdown("---")
 
-            participant_count = sum(1 for g in st.session_state.participant_groups.values() if g == group_name)
+            participant_count = participant_counts[group_name]
             st.markdown(f"**Participants in this group:** {participant_count}")
 
             # Sections selection
             st.markdown("**Select Sections for Analysis:**")
-            available_sections = list(st.session_state.sections.keys()) if hasattr(st.session_state, 'sections') else []
             if available_sections:
-                def update_sections(grp_name):
-                    """Callback to update sections selection."""
-                    st.session_state.groups[grp_name]["selected_sections"] = st.session_state[f"sections_select_{grp_name}"]
-                    auto_save_config()
-                    show_toast(f"Sections updated for {grp_name}", icon="success")
-
                 st.multiselect(
                     "Sections to use in analysis",
                     options=available_sections,
                     default=group_data.get("selected_sections", []),
                     key=f"sections_select_{group_name}",
                     help="Choose which sections to analyze for participants in this group (saves automatically)",
-                    on_change=update_sections,
+                    on_change=_update_group_sections,
                     args=(group_name,),
                 )
             else:
@@ -467,63 +545,38 @@ def _render_groups_section():
             st.markdown("**Select Expected Events:**")
             expected_events = group_data.get("expected_events", {})
 
-            st.markdown("*Click events to add/remove from this group (saves automatically):*")
-
-            num_cols = 3
-            cols = st.columns(num_cols)
-
-            available_event_names = list(st.session_state.all_events.keys())
-            for idx, event_name in enumerate(available_event_names):
-                col_idx = idx % num_cols
-                with cols[col_idx]:
-                    is_selected = event_name in expected_events
-
-                    def toggle_event(grp_name, evt_name, currently_selected):
-                        """Callback to toggle event selection."""
-                        # Ensure expected_events exists
-                        if "expected_events" not in st.session_state.groups[grp_name]:
-                            st.session_state.groups[grp_name]["expected_events"] = {}
-                        exp_events = st.session_state.groups[grp_name]["expected_events"]
-                        if st.session_state[f"event_select_{grp_name}_{evt_name}"]:
-                            if evt_name not in exp_events:
-                                exp_events[evt_name] = st.session_state.all_events[evt_name].copy()
-                                st.session_state.groups[grp_name]["expected_events"] = exp_events
-                                auto_save_config()
-                                show_toast(f"Added '{evt_name}' to {grp_name}", icon="success")
-                        else:
-                            if evt_name in exp_events:
-                                del exp_events[evt_name]
-                                st.session_state.groups[grp_name]["expected_events"] = exp_events
-                                auto_save_config()
-                                show_toast(f"Removed '{evt_name}' from {grp_name}", icon="info")
-
-                    st.checkbox(
-                        event_name,
-                        value=is_selected,
-                        key=f"event_select_{group_name}_{event_name}",
-                        on_change=toggle_event,
-                        args=(group_name, event_name, is_selected),
-                    )
+            # Sync the widget from the group, since renames/deletes elsewhere change it
+            events_key = f"events_ms_{group_name}"
+            current_events = [e for e in expected_events if e in st.session_state.all_events]
+            if st.session_state.get(events_key) != current_events:
+                st.session_state[events_key] = current_events
+
+            st.multiselect(
+                "Expected events",
+                options=available_event_names,
+                key=events_key,
+                help="Add or remove events expected for this group (saves automatically)",
+                on_change=_sync_expected_events,
+                args=(group_name,),
+            )
 
             st.markdown("---")
 
             # Show currently selected events
             if expected_events:
                 st.markdown("**Currently Selected Events:**")
-                events_list = []
-                for event_name_item, synonyms in expected_events.items():
-                    events_list.append({
-                        "Event Name": event_name_item,
-                        "Synonyms": ", ".join(synonyms[:3]) + ("..." if len(synonyms) > 3 else "") if synonyms else "No synonyms",
-                    })
+                events_rows = []
+                events_lines = []
+                for event_name_item in expected_events:
+                    syn_text, syn_md = synonym_preview(event_name_item)
+                    events_rows.append((event_name_item, syn_text))
+                    events_lines.append(f"- **{event_name_item}**: {syn_md}")
 
-                df_group_events = pd.DataFrame(events_list)
-                st.dataframe(df_group_events, width='stretch', hide_index=True)
+                st.markdown("\n".join(events_lines))
 
-                csv_group_events = df_group_events.to_csv(index=False)
                 st.download_button(
                     label=f"Download Events for {group_name}",
-                    data=csv_group_events,
+                    data=functools.partial(_group_events_csv, tuple(events_rows)),
                     file_name=f"group_events_{group_name}.csv",
                     mime="text/csv",
                     key=f"download_group_{group_name}"
@@ -534,19 +587,10 @@ def _render_groups_section():
             # Delete group
             st.markdown("---")
 
-            def delete_group(grp_name):
-                """Callback to delete group."""
-                for pid, gname in st.session_state.participant_groups.items():
-                    if gname == grp_name:
-                        st.session_state.participant_groups[pid] = "Default"
-                del st.session_state.groups[grp_name]
-                auto_save_config()
-                show_toast(f"Deleted group '{grp_name}' and reassigned participants to Default", icon="success")
-
             st.button(
                 f"Delete Group '{group_name}'",
                 key=f"delete_group_{group_name}",
-                on_click=delete_group,
+                on_click=_delete_group,
                 args=(group_name,),
                 type="secondary",
             )
@@ -555,8 +599,55 @@ def _render_groups_section():
     st.info("**All changes save automatically** when you modify group settings or select events.")
 
 
+def _create_playlist_group():
+    """Callback to create new playlist group."""
+    new_playlist_name = st.session_state.get("new_playlist_name", "")
+    new_playlist_label = st.session_state.get("new_playlist_label", "")
+    new_playlist_order = st.session_state.get("new_playlist_order", "")
+    if new_playlist_name and new_playlist_name not in st.session_state.playlist_groups:
+        order_list = [m.strip() for m in new_playlist_order.split(",") if m.strip()]
+        if not order_list:
+            order_list = ["music_1", "music_2", "music_3"]
+        st.session_state.playlist_groups[new_playlist_name] = {
+            "label": new_playlist_label or new_playlist_name,
+            "music_order": order_list
+        }
+        save_playlist_groups(st.session_state.playlist_groups)
+        queue_toast(f"Created playlist group '{new_playlist_name}'", icon="success")
+    elif new_playlist_name in st.session_state.playlist_groups:
+        queue_toast(f"Playlist group '{new_playlist_name}' already exists", icon="error")
+
+
+def _save_playlist_changes(pl_name):
+    """Callback to save a playlist group's label and music order."""
+    new_ord = st.session_state.get(f"edit_playlist_order_{pl_name}", "")
+    new_lbl = st.session_state.get(f"edit_playlist_label_{pl_name}", pl_name)
+    order_list = [m.strip() for m in new_ord.split(",") if m.strip()]
+    if order_list:
+        st.session_state.playlist_groups[pl_name]["music_order"] = order_list
+    st.session_state.playlist_groups[pl_name]["label"] = new_lbl
+    save_playlist_groups(st.session_state.playlist_groups)
+    queue_toast(f"Updated '{pl_name}'", icon="success")
+
+
+def _delete_playlist(pl_name):
+    """Callback to delete a playlist group and its participant assignments."""
+    del st.session_state.playlist_groups[pl_name]
+    for pid in list(st.session_state.participant_playlists.keys()):
+        if st.session_state.participant_playlists.get(pid) == pl_name:
+            del st.session_state.participant_playlists[pid]
+    # Also remove from participant_randomizations
+    for pid in list(st.session_state.get("participant_randomizations", {}).keys()):
+        if st.session_state.participant_randomizations.get(pid) == pl_name:
+            del st.session_state.participant_randomizations[pid]
+    save_playlist_groups(st.session_state.playlist_groups)
+    queue_toast(f"Deleted playlist group '{pl_name}'", icon="success")
+
+
+@st.fragment
 def _render_playlists_section():
     """Render the Playlists sub-section for music randomization."""
+    flush_toasts()
     st.subheader("Playlist Groups (Music Randomization)")
 
     with st.expander("Help - Playlist Groups", expanded=False):
@@ -600,31 +691,17 @@ def _render_playlists_section():
 
     # Create new playlist group
     with st.expander("Create New Playlist Group"):
-        new_playlist_name = st.text_input(
+        st.text_input(
             "Playlist Group ID (e.g., playlist_06)",
             key="new_playlist_name"
         )
-        new_playlist_label = st.text_input("Playlist Group Label", key="new_playlist_label")
-        new_playlist_order = st.text_input(
+        st.text_input("Playlist Group Label", key="new_playlist_label")
+        st.text_input(
             "Music Order (comma-separated, e.g., music_2, music_1, music_3)",
             key="new_playlist_order"
         )
 
-        def create_playlist_group():
-            if new_playlist_name and new_playlist_name not in st.session_state.playlist_groups:
-                order_list = [m.strip() for m in new_playlist_order.split(",") if m.strip()]
-                if not order_list:
-                    order_list = ["music_1", "music_2", "music_3"]
-                st.session_state.playlist_groups[new_playlist_name] = {
-                    "label": new_playlist_label or new_playlist_name,
-                    "music_order": order_list
-                }
-                save_playlist_groups(st.session_state.playlist_groups)
-                show_toast(f"Created playlist group '{new_playlist_name}'", icon="success")
-            elif new_playlist_name in st.session_state.playlist_groups:
-                show_toast(f"Playlist group '{new_playlist_name}' already exists", icon="error")
-
-        st.button("Create Playlist Group", key="create_playlist_btn", on_click=create_playlist_group)
+        st.button("Create Playlist Group", key="create_playlist_btn", on_click=_create_playlist_group)
 
     # Show existing playlist groups
     st.markdown("---")
@@ -633,10 +710,10 @@ def _render_playlists_section():
     if not st.session_state.playlist_groups:
         st.info("No playlist groups defined yet. Create one above.")
     else:
-        for playlist_name, playlist_data in list(st.session_state.playlist_groups.items()):
+        for playlist_name, playlist_data in st.session_state.playlist_groups.items():
             with st.expander(f"{playlist_name} - {playlist_data['label']}"):
                 # Edit label
-                new_label = st.text_input(
+                st.text_input(
                     "Label",
                     value=playlist_data.get('label', playlist_name),
                     key=f"edit_playlist_label_{playlist_name}"
@@ -644,7 +721,7 @@ def _render_playlists_section():
 
                 st.markdown(f"**Music Order:** {' -> '.join(playlist_data['music_order'])}")
 
-                new_order = st.text_input(
+                st.text_input(
                     "Edit Music Order (comma-separated)",
                     value=", ".join(playlist_data['music_order']),
                     key=f"edit_playlist_order_{playlist_name}"
@@ -652,38 +729,18 @@ def _render_playlists_section():
 
                 col_pl1, col_pl2, col_pl3 = st.columns(3)
                 with col_pl1:
-                    def save_playlist_changes(pl_name, new_ord, new_lbl):
-                        order_list = [m.strip() for m in new_ord.split(",") if m.strip()]
-                        if order_list:
-                            st.session_state.playlist_groups[pl_name]["music_order"] = order_list
-                        st.session_state.playlist_groups[pl_name]["label"] = new_lbl
-                        save_playlist_groups(st.session_state.playlist_groups)
-                        show_toast(f"Updated '{pl_name}'", icon="success")
-
                     st.button(
                         "Save Changes",
                         key=f"save_playlist_{playlist_name}",
-                        on_click=save_playlist_changes,
-                        args=(playlist_name, new_order, new_label)
+                        on_click=_save_playlist_changes,
+                        args=(playlist_name,)
                     )
 
                 with col_pl3:
-                    def delete_playlist(pl_name):
-                        del st.session_state.playlist_groups[pl_name]
-                        for pid in list(st.session_state.participant_playlists.keys()):
-                            if st.session_state.participant_playlists.get(pid) == pl_name:
-                                del st.session_state.participant_playlists[pid]
-                        # Also remove from participant_randomizations
-                        for pid in list(st.session_state.get("participant_randomizations", {}).keys()):
-                            if st.session_state.participant_randomizations.get(pid) == pl_name:
-                                del st.session_state.participant_randomizations[pid]
-                        save_playlist_groups(st.session_state.playlist_groups)
-                        show_toast(f"Deleted playlist group '{pl_name}'", icon="success")
-
                     st.button(
                         "Delete",
                         key=f"delete_playlist_{playlist_name}",
-                        on_click=delete_playlist,
+                        on_click=_delete_playlist,
                         args=(playlist_name,),
                         type="secondary"
                     )
@@ -750,7 +807,7 @@ def _render_playlists_section():
                 }
             # Save to persistence (dedicated music_labels file)
             save_music_labels(st.session_state.music_labels)
-            show_toast("Music labels saved", icon="success")
+            queue_toast("Music labels saved", icon="success")
 
         st.button("Save Music Labels", key="save_music_labels_btn", on_click=save_music_labels_callback, type="primary")
     else:
@@ -760,8 +817,10 @@ def _render_playlists_section():
     st.info("**All changes save automatically.** Playlist labels are used in the Data tab.")
 
 
+@st.fragment
 def _render_sections_section():
     """Render the Sections sub-section."""
+    flush_toasts()
     st.subheader("Sections")
 
     with st.expander("Help - Sections", expanded=False):
@@ -899,7 +958,6 @@ def _render_sections_section():
 
         df_sections = pd.DataFrame(sections_list)
 
-        available_events = list(st.session_state.all_events.keys())
         edited_sections = st.data_editor(
             df_sections,
             width='stretch',
@@ -85,9 +85,11 @@ if folder:
 
     try:
         # Run in subprocess - this won't block Streamlit
+        # Only stdout carries the result; tkinter warnings on stderr are dropped
         result = subprocess.run(
             [sys.executable, "-c", script],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
             timeout=120,  # 2 minute timeout for user to select
         )
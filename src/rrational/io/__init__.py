@@ -6,6 +6,7 @@ from rrational.io.hrv_logger import (
     DuplicateInfo,
     EventMarker,
     HRVLoggerRecording,
+    RRChunk,
     RRInterval,
     RecordingBundle,
     discover_recordings,
@@ -14,6 +15,7 @@ from rrational.io.hrv_logger import (
     load_recording,
     load_recordings_from_directory,
     load_rr_intervals,
+    load_rr_intervals_chunked,
 )
 
 from rrational.io.vns_analyse import (
@@ -31,6 +33,7 @@ __all__ = [
     "DuplicateInfo",
     "EventMarker",
     "HRVLoggerRecording",
+    "RRChunk",
     "RRInterval",
     "RecordingBundle",
     "discover_recordings",
@@ -39,6 +42,7 @@ __all__ = [
     "load_recording",
     "load_recordings_from_directory",
     "load_rr_intervals",
+    "load_rr_intervals_chunked",
     # VNS Analyse
     "VNSRecording",
     "VNSRecordingBundle",
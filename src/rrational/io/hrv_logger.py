@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import csv
-import io
+import os
 import re
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from fnmatch import fnmatch
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import Any, TypeVar
+
+import numpy as np
+import pandas as pd
 
 # Pattern for participant ID: 4 digits followed by 4 uppercase letters (e.g., 0123ABCD)
 DEFAULT_ID_PATTERN = r"(?P<participant>\d{4}[A-Z]{4})"
@@ -21,28 +34,56 @@ PREDEFINED_PATTERNS = {
     "Letters + digits (e.g., P001, SUB123)": r"(?P<participant>[A-Za-z]+\d+)",
     "Underscore separated (e.g., sub_001)": r"(?P<participant>[A-Za-z]+_\d+)",
 }
+_ID_TOKEN = re.compile(r"[A-Za-z0-9]+")  # Fallback when the ID pattern doesn't match
 _RR_REQUIRED_COLUMNS = ("date", "rr")
 _EVENT_REQUIRED_COLUMNS = ("annotation", "timestamp")
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S %z"
+
+# Parsed CSVs keyed by (parser, path), tagged with the (mtime_ns, size) they
+# were read at and their row count; least recently used files are dropped once
+# the cached rows exceed _PARSE_CACHE_MAX_ROWS. Hits share the (frozen)
+# RRInterval/EventMarker/DuplicateInfo objects, only lists are copied
+_PARSE_CACHE: OrderedDict[tuple[Callable, Path], tuple[tuple[int, int], int, Any]] = OrderedDict()
+_PARSE_CACHE_MAX_ROWS = 500_000
+_PARSE_CACHE_LOCK = threading.Lock()  # Streamlit sessions run on separate threads
+_parse_cache_rows = 0
+_T = TypeVar("_T")
+
+
+@contextmanager
+def _prepare_reader(path: Path) -> Iterator[tuple[dict[str, int], Iterator[list[str]]]]:
+    """Open ``path`` for streaming and yield its header index plus a row reader.
+
+    The header is lowercased + stripped once per file, mapping each column
+    name to its position so rows can be indexed by int. The file is opened with
+    ``newline=""`` so ``csv`` handles ``\r\n``/``\r``/``\n`` itself and only
+    one buffered chunk is held in memory at a time.
+    """
 
+    with path.open(encoding="utf-8", errors="ignore", newline="") as handle:
+        reader = csv.reader(handle)
+        header = next(reader, None) or ()
+        yield {name.strip().lower(): idx for idx, name in enumerate(header)}, reader
 
-def _prepare_reader(path: Path) -> csv.DictReader:
-    """Return a CSV reader with stripped headers/body."""
 
-    text = path.read_text(encoding="utf-8", errors="ignore")
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    return csv.DictReader(io.StringIO(text))
+def _int_column(values: Sequence[int], dtype: type[np.signedinteger]) -> np.ndarray:
+    """Pack ints into the narrow ``dtype``, keeping int64 if any value doesn't fit."""
 
+    column = np.asarray(values, dtype=np.int64)
+    limits = np.iinfo(dtype)
+    if column.size and (column.min() < limits.min or column.max() > limits.max):
+        return column
+    return column.astype(dtype)
 
-def _normalise_row(row: dict[str, str | None]) -> dict[str, str]:
-    """Lowercase + strip CSV keys/values for tolerant parsing."""
 
-    return {
-        (key.strip().lower() if key else ""): (value or "").strip()
-        for key, value in row.items()
-    }
+def _datetime64_column(timestamps: list[datetime | None]) -> np.ndarray:
+    """Convert (possibly mixed-offset) datetimes to UTC ``datetime64[ms]``."""
 
+    stamps = pd.to_datetime(timestamps, utc=True)
+    return stamps.tz_localize(None).to_numpy().astype("datetime64[ms]")
 
-@dataclass(slots=True)
+
+@dataclass(slots=True, frozen=True)
 class RRInterval:
     """Single beat from the HRV Logger RR CSV."""
 
@@ -51,7 +92,7 @@ class RRInterval:
     elapsed_ms: int | None
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class DuplicateInfo:
     """Information about a detected duplicate RR interval."""
 
@@ -62,7 +103,7 @@ class DuplicateInfo:
     elapsed_str: str
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class EventMarker:
     """Marker/annotation extracted from the Events CSV."""
 
@@ -97,24 +138,73 @@ class RecordingBundle:
 
 @dataclass(slots=True)
 class HRVLoggerRecording:
-    """Full HRV Logger recording (RR beats + optional events)."""
+    """Full HRV Logger recording (RR beats + optional events).
+
+    ``rr_intervals`` stays the canonical per-beat list; the ``*_arr``
+    properties expose the same beats column-wise for vectorised analysis.
+    """
 
     participant_id: str
     rr_intervals: list[RRInterval]
     events: list[EventMarker]
 
+    @property
+    def rr_ms_arr(self) -> np.ndarray:
+        """RR durations in ms (int16; int64 if a value doesn't fit)."""
+        return _int_column([rr.rr_ms for rr in self.rr_intervals], np.int16)
+
+    @property
+    def elapsed_ms_arr(self) -> np.ndarray:
+        """"Since start" values in ms (int32, 0 where ``elapsed_ms_missing``)."""
+        return _int_column(
+            [0 if rr.elapsed_ms is None else rr.elapsed_ms for rr in self.rr_intervals], np.int32
+        )
+
+    @property
+    def elapsed_ms_missing(self) -> np.ndarray:
+        """Boolean mask of beats without a "since start" value."""
+        return np.fromiter(
+            (rr.elapsed_ms is None for rr in self.rr_intervals),
+            dtype=bool,
+            count=len(self.rr_intervals),
+        )
+
+    @property
+    def timestamps_arr(self) -> np.ndarray:
+        """Beat timestamps as UTC ``datetime64[ms]`` (NaT where missing)."""
+        return _datetime64_column([rr.timestamp for rr in self.rr_intervals])
+
+
+@dataclass(slots=True)
+class RRChunk:
+    """Column arrays for one window of beats from ``load_rr_intervals_chunked``."""
+
+    rr_ms: np.ndarray  # int16 (int64 if a value doesn't fit)
+    elapsed_ms: np.ndarray  # int32, 0 where elapsed_ms_missing
+    elapsed_ms_missing: np.ndarray  # bool
+    timestamps: np.ndarray  # UTC datetime64[ms], NaT where missing
+    duplicates: list[DuplicateInfo]  # Duplicate rows skipped while reading this chunk
+
+
+@lru_cache(maxsize=32)
+def _compile_id(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern)
+
 
 def extract_participant_id(name: str, pattern: str = DEFAULT_ID_PATTERN) -> str:
     """Return the participant identifier derived from file names."""
 
     stem = Path(name).stem
-    regex = re.compile(pattern)
-    matches = list(regex.finditer(stem))
-    for match in reversed(matches):
-        participant = match.groupdict().get("participant")
-        if participant:
-            return participant
-    tokens = re.findall(r"[A-Za-z0-9]+", stem)
+    regex = _compile_id(pattern)
+    participant = None
+    if "participant" in regex.groupindex:
+        # Rightmost match with a non-empty ID wins; a forward scan keeps the
+        # last one seen without materialising the match list
+        for match in regex.finditer(stem):
+            participant = match.group("participant") or participant
+    if participant:
+        return participant
+    tokens = _ID_TOKEN.findall(stem)
     if tokens:
         return tokens[-1]
     return "unknown"
@@ -133,32 +223,59 @@ def discover_recordings(
     rr_index: dict[str, list[Path]] = {}
     events_index: dict[str, list[Path]] = {}
 
-    for rr_path in sorted(root.rglob("*RR*.csv")):
-        participant = extract_participant_id(rr_path.name, pattern)
-        rr_index.setdefault(participant, []).append(rr_path)
-
-    for events_path in sorted(root.rglob("*Events*.csv")):
-        participant = extract_participant_id(events_path.name, pattern)
-        events_index.setdefault(participant, []).append(events_path)
+    # One walk over the tree classifies RR and Events files together
+    # (like rglob, symlinked folders are not followed and unreadable ones skipped)
+    for dirpath, _, filenames in os.walk(root, followlinks=False):
+        folder = Path(dirpath)
+        for name in filenames:
+            is_rr = fnmatch(name, "*RR*.csv")
+            is_events = fnmatch(name, "*Events*.csv")
+            if not (is_rr or is_events):
+                continue
+            path = folder / name
+            participant = sys.intern(extract_participant_id(name, pattern))
+            if is_rr:
+                rr_index.setdefault(participant, []).append(path)
+            if is_events:
+                events_index.setdefault(participant, []).append(path)
 
     bundles: list[RecordingBundle] = []
     for participant, rr_paths in sorted(rr_index.items()):
-        events_paths = events_index.get(participant) or []
+        events_paths = sorted(events_index.get(participant) or [])
         bundles.append(
             RecordingBundle(
                 participant_id=participant,
-                rr_paths=rr_paths,  # All RR files for this participant
+                rr_paths=sorted(rr_paths),  # All RR files for this participant
                 events_paths=events_paths,  # All Events files
             )
         )
     return bundles
 
 
+def _parse_hrvlogger_ts(value: str) -> datetime | None:
+    """Fast path for the fixed ``YYYY-MM-DD HH:MM:SS +HHMM`` HRV Logger layout.
+
+    Only strings of exactly that shape are handed to ``fromisoformat``, which
+    reads the digits in C and yields the same datetime/offset as ``strptime``
+    with ``_DATE_FORMAT``. Anything else returns None for the slow path.
+    """
+
+    if len(value) != 25 or value[10] != " " or value[19] != " ":
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
 def _parse_datetime(value: str | None) -> datetime | None:
     if not value:
         return None
+    parsed = _parse_hrvlogger_ts(value)
+    if parsed is not None:
+        return parsed
     try:
-        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S %z")
+        return datetime.strptime(value, _DATE_FORMAT)
     except ValueError:
         try:
             return datetime.fromisoformat(value)
@@ -166,41 +283,162 @@ def _parse_datetime(value: str | None) -> datetime | None:
             return None
 
 
+def _parse_logger_dates(values: list[str]) -> list[datetime | None]:
+    """Parse HRV Logger-formatted dates (fast path first, see ``_parse_datetime``)."""
+
+    return [_parse_datetime(value) for value in values]
+
+
+def _parse_iso_dates(values: list[str]) -> list[datetime | None]:
+    """Parse ISO-8601 dates, trying ``fromisoformat`` before ``_DATE_FORMAT``."""
+
+    parsed: list[datetime | None] = []
+    for value in values:
+        try:
+            parsed.append(datetime.fromisoformat(value))
+        except ValueError:
+            parsed.append(_parse_datetime(value))
+    return parsed
+
+
+def _pick_date_parser(sample: str) -> Callable[[list[str]], list[datetime | None]]:
+    """Choose the column parser from one sample so other formats don't pay for
+    a failed ``strptime`` on every row."""
+
+    try:
+        datetime.strptime(sample, _DATE_FORMAT)
+    except ValueError:
+        return _parse_iso_dates
+    return _parse_logger_dates
+
+
+def _parse_datetimes(values: list[str]) -> list[datetime | None]:
+    """Parse a whole date column at once; same results as ``_parse_datetime``."""
+
+    sample = next((value for value in values if value), None)
+    if sample is None:
+        return [None] * len(values)
+    return _pick_date_parser(sample)(values)
+
+
 def _parse_int(value: str | None) -> int | None:
     if not value:
         return None
+    try:
+        return int(value)  # Plain integers ("812") skip the float round-trip
+    except ValueError:
+        pass
     try:
         return int(float(value))
     except ValueError:
         return None
 
 
+def _parse_floats(values: list[str]) -> list[float | None]:
+    """Parse a numeric column in one NumPy conversion.
+
+    Columns with blank or invalid entries fall back to per-value parsing,
+    where those entries become None.
+    """
+
+    try:
+        return np.asarray(values, dtype=np.float64).tolist()
+    except ValueError:
+        pass
+    parsed: list[float | None] = []
+    for value in values:
+        try:
+            parsed.append(float(value) if value else None)
+        except ValueError:
+            parsed.append(None)
+    return parsed
+
+
+def _load_cached(
+    path: Path, parse: Callable[[Path], _T], count_rows: Callable[[_T], int] = len
+) -> _T:
+    """Return ``parse(path)``, reusing the last result while the file is unchanged.
+
+    ``count_rows`` sizes a result for the cache's row budget; a file larger
+    than the whole budget is parsed but not cached.
+    """
+
+    global _parse_cache_rows
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    key = (parse, path)
+    with _PARSE_CACHE_LOCK:
+        cached = _PARSE_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            _PARSE_CACHE.move_to_end(key)
+            return cached[2]
+
+    # Parse outside the lock so other sessions aren't held up by a long file
+    result = parse(path)
+    rows = count_rows(result)
+    with _PARSE_CACHE_LOCK:
+        replaced = _PARSE_CACHE.pop(key, None)
+        if replaced is not None:
+            _parse_cache_rows -= replaced[1]
+        if rows <= _PARSE_CACHE_MAX_ROWS:
+            _PARSE_CACHE[key] = (stamp, rows, result)
+            _parse_cache_rows += rows
+            while _parse_cache_rows > _PARSE_CACHE_MAX_ROWS:
+                _parse_cache_rows -= _PARSE_CACHE.popitem(last=False)[1][1]
+    return result
+
+
 def load_rr_intervals(rr_path: Path) -> tuple[list[RRInterval], int, list[DuplicateInfo]]:
     """Parse RR CSV rows and detect exact duplicate rows.
 
     A duplicate is defined as:
     - Entire row is identical (date + rr + since_start values all match)
 
+    Unchanged files are served from an in-memory cache instead of re-parsing.
+
     Returns:
         tuple: (list of unique RR intervals, count of duplicates removed, list of duplicate details)
     """
 
-    intervals: list[RRInterval] = []
+    intervals, duplicate_count, duplicates_list = _load_cached(
+        rr_path, _parse_rr_intervals, lambda parsed: len(parsed[0]) + len(parsed[2])
+    )
+    return list(intervals), duplicate_count, list(duplicates_list)
+
+
+def _scan_rr_rows(
+    header: dict[str, int], reader: Iterator[list[str]], duplicates: list[DuplicateInfo]
+) -> Iterator[tuple[str, int, int | None]]:
+    """Yield ``(date_str, rr_ms, elapsed_ms)`` for each unique, parseable RR row.
+
+    A duplicate is an entire row identical to an earlier one (date + rr +
+    since_start values all match); it is recorded in ``duplicates`` and skipped.
+    """
+
     seen_rows: dict[tuple, int] = {}  # (timestamp_str, rr_str, elapsed_str) -> line number
-    duplicates_list: list[DuplicateInfo] = []
     line_num = 0  # Track CSV line number (including header)
 
-    for row in _prepare_reader(rr_path):
-        line_num += 1
+    # Resolve column positions once; rows are then indexed by int
+    date_idx = header["date"]
+    rr_idx = header["rr"]
+    elapsed_cols = [header[col] for col in ("since start", "since_start") if col in header]
+    width = max(header.values()) + 1
 
-        cleaned = _normalise_row(row)
-        if not all(col in cleaned for col in _RR_REQUIRED_COLUMNS):
-            continue
+    for row in reader:
+        if not row:
+            continue  # Blank line
+        line_num += 1
+        if len(row) < width:
+            row.extend([""] * (width - len(row)))
 
         # Parse values
-        date_str = cleaned.get("date", "")
-        rr_str = cleaned.get("rr", "")
-        elapsed_str = cleaned.get("since start") or cleaned.get("since_start", "")
+        date_str = row[date_idx].strip()
+        rr_str = row[rr_idx].strip()
+        elapsed_str = ""
+        for idx in elapsed_cols:
+            elapsed_str = row[idx].strip()
+            if elapsed_str:
+                break
 
         # Create fingerprint of entire row
         row_fingerprint = (date_str, rr_str, elapsed_str)
@@ -208,7 +446,7 @@ def load_rr_intervals(rr_path: Path) -> tuple[list[RRInterval], int, list[Duplic
         # Check if this EXACT row was seen before
         if row_fingerprint in seen_rows:
             original_line = seen_rows[row_fingerprint]
-            duplicates_list.append(
+            duplicates.append(
                 DuplicateInfo(
                     original_line=original_line,
                     duplicate_line=line_num + 1,  # +1 because line 1 is header
@@ -221,52 +459,110 @@ def load_rr_intervals(rr_path: Path) -> tuple[list[RRInterval], int, list[Duplic
 
         seen_rows[row_fingerprint] = line_num + 1  # +1 because line 1 is header
 
-        # Now parse the actual values
-        timestamp = _parse_datetime(date_str)
+        # Now parse the actual values (dates are parsed in batches by the caller)
         rr_ms = _parse_int(rr_str)
-        elapsed_ms = _parse_int(elapsed_str)
-
         if rr_ms is None:
             continue
+        yield date_str, rr_ms, _parse_int(elapsed_str)
 
-        intervals.append(
-            RRInterval(
-                timestamp=timestamp,
-                rr_ms=rr_ms,
-                elapsed_ms=elapsed_ms,
-            )
-        )
 
+def _parse_rr_intervals(rr_path: Path) -> tuple[list[RRInterval], int, list[DuplicateInfo]]:
+    dates: list[str] = []
+    rr_values: list[int] = []
+    elapsed_values: list[int | None] = []
+    duplicates_list: list[DuplicateInfo] = []
+
+    with _prepare_reader(rr_path) as (header, reader):
+        if not all(col in header for col in _RR_REQUIRED_COLUMNS):
+            return [], 0, duplicates_list
+        for date_str, rr_ms, elapsed_ms in _scan_rr_rows(header, reader, duplicates_list):
+            dates.append(date_str)
+            rr_values.append(rr_ms)
+            elapsed_values.append(elapsed_ms)
+
+    intervals = [
+        RRInterval(timestamp=timestamp, rr_ms=rr_ms, elapsed_ms=elapsed_ms)
+        for timestamp, rr_ms, elapsed_ms in zip(_parse_datetimes(dates), rr_values, elapsed_values)
+    ]
     return intervals, len(duplicates_list), duplicates_list
 
 
-def load_events(events_path: Path) -> list[EventMarker]:
-    """Parse HRV Logger Events CSV rows."""
+def load_rr_intervals_chunked(
+    rr_path: Path, chunksize: int = 100_000
+) -> Iterator[RRChunk]:
+    """Stream an RR CSV as column arrays of at most ``chunksize`` beats.
 
-    markers: list[EventMarker] = []
-    for row in _prepare_reader(events_path):
-        cleaned = _normalise_row(row)
-        if not all(col in cleaned for col in _EVENT_REQUIRED_COLUMNS):
-            continue
-        label = cleaned.get("annotation") or ""
-        if not label:
-            continue
-        timestamp = _parse_datetime(cleaned.get("date"))
-        offset_s: float | None = None
-        ts_value = cleaned.get("timestamp")
-        if ts_value:
-            try:
-                offset_s = float(ts_value)
-            except ValueError:
-                offset_s = None
-        markers.append(
-            EventMarker(
-                label=label,
-                timestamp=timestamp,
-                offset_s=offset_s,
+    For recordings too long to hold as ``RRInterval`` objects: only the
+    current chunk's values are materialised. Rows are de-duplicated across the
+    whole file exactly like ``load_rr_intervals``, which keeps one fingerprint
+    per unique row; duplicates found after the last beat arrive in a final
+    chunk with empty arrays. Results are not cached.
+    """
+
+    duplicates: list[DuplicateInfo] = []
+    with _prepare_reader(rr_path) as (header, reader):
+        if not all(col in header for col in _RR_REQUIRED_COLUMNS):
+            return
+        rows = _scan_rr_rows(header, reader, duplicates)
+        while chunk := list(islice(rows, chunksize)):
+            dates, rr_values, elapsed_values = zip(*chunk)
+            chunk_duplicates = duplicates.copy()
+            duplicates.clear()
+            yield RRChunk(
+                rr_ms=_int_column(rr_values, np.int16),
+                elapsed_ms=_int_column([elapsed or 0 for elapsed in elapsed_values], np.int32),
+                elapsed_ms_missing=np.array([elapsed is None for elapsed in elapsed_values]),
+                timestamps=_datetime64_column(_parse_datetimes(list(dates))),
+                duplicates=chunk_duplicates,
             )
+    if duplicates:
+        # Duplicates found after the last full chunk: report them without beats
+        yield RRChunk(
+            rr_ms=_int_column([], np.int16),
+            elapsed_ms=_int_column([], np.int32),
+            elapsed_ms_missing=np.array([], dtype=bool),
+            timestamps=_datetime64_column([]),
+            duplicates=duplicates,
         )
-    return markers
+
+
+def load_events(events_path: Path) -> list[EventMarker]:
+    """Parse HRV Logger Events CSV rows (cached while the file is unchanged)."""
+
+    return list(_load_cached(events_path, _parse_events))
+
+
+def _parse_events(events_path: Path) -> list[EventMarker]:
+    labels: list[str] = []
+    dates: list[str] = []
+    offsets: list[str] = []
+    with _prepare_reader(events_path) as (header, reader):
+        if not all(col in header for col in _EVENT_REQUIRED_COLUMNS):
+            return []
+
+        label_idx = header["annotation"]
+        offset_idx = header["timestamp"]
+        date_idx = header.get("date")
+        width = max(header.values()) + 1
+
+        for row in reader:
+            if not row:
+                continue  # Blank line
+            if len(row) < width:
+                row.extend([""] * (width - len(row)))
+            label = row[label_idx].strip()
+            if not label:
+                continue
+            labels.append(sys.intern(label))  # Labels repeat a lot; share one str each
+            dates.append(row[date_idx].strip() if date_idx is not None else "")
+            offsets.append(row[offset_idx].strip())
+
+    return [
+        EventMarker(label=label, timestamp=timestamp, offset_s=offset_s)
+        for label, timestamp, offset_s in zip(
+            labels, _parse_datetimes(dates), _parse_floats(offsets)
+        )
+    ]
 
 
 def load_recording(bundle: RecordingBundle) -> tuple[HRVLoggerRecording, int, list[DuplicateInfo]]:
@@ -312,20 +608,29 @@ def load_recording(bundle: RecordingBundle) -> tuple[HRVLoggerRecording, int, li
 
 
 def load_recordings_from_directory(
-    root: Path, *, pattern: str = DEFAULT_ID_PATTERN
+    root: Path, *, pattern: str = DEFAULT_ID_PATTERN, workers: int | None = None
 ) -> list[tuple[HRVLoggerRecording, int]]:
     """Convenience helper returning fully parsed recordings.
 
+    Bundles are parsed serially by default, which reuses the in-memory parse
+    cache. Pass ``workers`` > 1 to parse participants in a process pool
+    instead; on spawn platforms the caller then needs an
+    ``if __name__ == "__main__"`` guard.
+
     Returns:
         list of tuples: [(HRVLoggerRecording, duplicate_count), ...]
     """
 
     bundles = discover_recordings(root, pattern=pattern)
-    return [load_recording(bundle) for bundle in bundles]
+    if workers is None or workers <= 1 or len(bundles) < 2:
+        return [load_recording(bundle) for bundle in bundles]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(load_recording, bundles, chunksize=4))
 
 
 __all__ = [
     "DEFAULT_ID_PATTERN",
+    "RRChunk",
     "RRInterval",
     "EventMarker",
     "RecordingBundle",
@@ -336,4 +641,5 @@ __all__ = [
     "load_recording",
     "load_recordings_from_directory",
     "load_rr_intervals",
+    "load_rr_intervals_chunked",
 ]
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime
 
@@ -55,12 +55,51 @@ class PreparationSummary:
     events_paths: list[Path] | None = None  # HRV Logger Events file paths
     vns_path: Path | None = None  # VNS Analyse file path (first file, for backward compat)
     vns_paths: list[Path] | None = None  # VNS Analyse file paths (all files)
+    # Formatted overview-table columns, filled lazily by ``table_row``
+    _table_row: dict[str, object] | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def has_multiple_files(self) -> bool:
         """Check if this participant has multiple recording files."""
         return self.rr_file_count > 1 or self.events_file_count > 1
 
+    @property
+    def table_row(self) -> dict[str, object]:
+        """Return the participants-overview columns derived from this summary alone.
+
+        Formatted once and kept on the summary; callers add the volatile
+        columns (group, saved status, device) on top.
+        """
+
+        row = getattr(self, "_table_row", None)
+        if row is None:
+            if self.source_app == "VNS Analyse":
+                # VNS has single TXT files (not separate RR/Events)
+                files_str = f"{self.rr_file_count} TXT"
+                multiple = self.rr_file_count > 1
+                # VNS data doesn't have duplicate events (only if same file loaded twice)
+                duplicate_events = 0
+            else:
+                # HRV Logger has separate RR and Events CSV files
+                files_str = f"{self.rr_file_count}RR/{self.events_file_count}Ev"
+                multiple = self.has_multiple_files
+                duplicate_events = self.duplicate_events
+            row = {
+                "Files": f"* {files_str}" if multiple else files_str,
+                "Date/Time": (
+                    self.recording_datetime.strftime("%Y-%m-%d %H:%M")
+                    if self.recording_datetime
+                    else ""
+                ),
+                "Artifacts (%)": f"{self.artifact_ratio * 100:.1f}",
+                "Duration (min)": f"{self.duration_s / 60:.1f}",
+                "Duplicate Events": duplicate_events,
+                "RR Range (ms)": f"{int(self.rr_min_ms)}-{int(self.rr_max_ms)}",
+                "Mean RR (ms)": f"{self.rr_mean_ms:.0f}",
+            }
+            object.__setattr__(self, "_table_row", row)
+        return row
+
     def as_row(self) -> tuple[str, ...]:
         """Return human readable values for tables."""
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 import unicodedata
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable
 
@@ -30,6 +31,43 @@ def _slugify(value: str) -> str:
     return normalized
 
 
+@lru_cache(maxsize=1024)
+def _compile(pattern: str, flags: int = re.IGNORECASE) -> re.Pattern[str]:
+    """Compile a synonym pattern, reusing it across normalizer rebuilds."""
+
+    return re.compile(pattern, flags)
+
+
+# Backreferences and conditionals refer to group numbers/names that shift
+# once a pattern is embedded in the combined alternation.
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+
+def _combine(patterns: dict[str, tuple[str, ...]]) -> re.Pattern[str] | None:
+    """Compile all synonyms into one alternation, or None if unsafe.
+
+    Each canonical name becomes a lookahead branch anchored at the start of
+    the slug, so ``match`` picks the first canonical (in config order) with
+    any synonym found anywhere in the slug, same as searching the patterns
+    one by one. Branch groups are named ``_sn<index>``.
+    """
+
+    branches = []
+    for index, synonyms in enumerate(patterns.values()):
+        if not synonyms:
+            continue
+        if any(_GROUP_REFERENCE.search(pattern) for pattern in synonyms):
+            return None
+        alternation = "|".join(f"(?:{pattern})" for pattern in synonyms)
+        branches.append(f"(?P<_sn{index}>(?=.*?(?:{alternation})))")
+    if not branches:
+        return None
+    try:
+        return _compile("|".join(branches))
+    except re.error:
+        return None
+
+
 @dataclass(slots=True)
 class SectionNormalizer:
     """Apply regex-based mappings to raw labels."""
@@ -37,14 +75,22 @@ class SectionNormalizer:
     config: SectionsConfig
     fallback_label: str = _DEFAULT_FALLBACK
     _pattern_cache: dict[str, tuple[re.Pattern[str], ...]] = field(init=False)
+    _combined: re.Pattern[str] | None = field(init=False)
+    _combined_names: tuple[str, ...] = field(init=False)
 
     def __post_init__(self) -> None:
         self._pattern_cache = {
             definition.name: tuple(
-                re.compile(pattern, re.IGNORECASE) for pattern in definition.synonyms
+                _compile(pattern) for pattern in definition.synonyms
             )
             for definition in self.config.sections.values()
         }
+        synonyms = {
+            definition.name: definition.synonyms
+            for definition in self.config.sections.values()
+        }
+        self._combined = _combine(synonyms)
+        self._combined_names = tuple(synonyms)
 
     @classmethod
     def from_yaml(
@@ -64,6 +110,12 @@ class SectionNormalizer:
         if not slug:
             return None if strict else self.fallback_label
 
+        if self._combined is not None:
+            match = self._combined.match(slug)
+            if match:
+                return self._combined_names[int(match.lastgroup[3:])]
+            return None if strict else self.fallback_label
+
         for canonical, patterns in self._pattern_cache.items():
             for pattern in patterns:
                 if pattern.search(slug):
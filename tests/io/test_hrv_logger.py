@@ -1,6 +1,16 @@
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
-from rrational.io import discover_recordings, load_recording, load_rr_intervals
+import numpy as np
+import pytest
+
+from rrational.io import (
+    discover_recordings,
+    load_recording,
+    load_recordings_from_directory,
+    load_rr_intervals,
+    load_rr_intervals_chunked,
+)
 
 FIXTURES = Path("tests/fixtures/hrv_logger")
 
@@ -34,6 +44,60 @@ def test_load_rr_intervals_parses_numeric_values(tmp_path):
     assert intervals[1].rr_ms == 150  # intentionally implausible for cleaning tests
 
 
+def test_load_rr_intervals_reparses_changed_file(tmp_path):
+    rr_path = tmp_path / "sample_RR_0001TEST.csv"
+    text = (FIXTURES / "sample_RR_0001TEST.csv").read_text(encoding="utf-8")
+    rr_path.write_text(text, encoding="utf-8")
+
+    first, _, _ = load_rr_intervals(rr_path)
+    first.clear()  # Callers get their own list
+    assert len(load_rr_intervals(rr_path)[0]) == 7
+
+    rr_path.write_text(text + "2025-03-20 09:00:15 +0000,610,2345\n", encoding="utf-8")
+    assert len(load_rr_intervals(rr_path)[0]) == 8
+
+
+def test_load_rr_intervals_cached_items_cannot_be_changed(tmp_path):
+    rr_path = tmp_path / "sample_RR_0001TEST.csv"
+    rr_path.write_text(
+        (FIXTURES / "sample_RR_0001TEST.csv").read_text(encoding="utf-8"),
+        encoding="utf-8",
+    )
+
+    first, _, _ = load_rr_intervals(rr_path)
+    with pytest.raises(FrozenInstanceError):
+        first[0].rr_ms = 1  # Would leak into every later load of the file
+    assert load_rr_intervals(rr_path)[0][0].rr_ms == 665
+
+
+def test_load_rr_intervals_chunked_matches_full_load(tmp_path):
+    rr_path = tmp_path / "sample_RR_0001TEST.csv"
+    text = (FIXTURES / "sample_RR_0001TEST.csv").read_text(encoding="utf-8")
+    rr_path.write_text(text + text.splitlines()[1] + "\n", encoding="utf-8")  # + duplicate
+
+    intervals, duplicates, _ = load_rr_intervals(rr_path)
+    chunks = list(load_rr_intervals_chunked(rr_path, chunksize=3))
+
+    assert [len(chunk.rr_ms) for chunk in chunks] == [3, 3, 1]
+    assert np.concatenate([chunk.rr_ms for chunk in chunks]).tolist() == [
+        rr.rr_ms for rr in intervals
+    ]
+    assert sum(len(chunk.duplicates) for chunk in chunks) == duplicates == 1
+
+
+def test_load_rr_intervals_chunked_keeps_trailing_duplicates(tmp_path):
+    rr_path = tmp_path / "sample_RR_0001TEST.csv"
+    lines = (FIXTURES / "sample_RR_0001TEST.csv").read_text(encoding="utf-8").splitlines()
+    rr_path.write_text("\n".join(lines[:7] + lines[1:2]) + "\n", encoding="utf-8")  # 6 unique + duplicate
+
+    _, duplicates, _ = load_rr_intervals(rr_path)
+    chunks = list(load_rr_intervals_chunked(rr_path, chunksize=3))
+
+    assert [len(chunk.rr_ms) for chunk in chunks] == [3, 3, 0]
+    assert chunks[-1].timestamps.dtype == np.dtype("datetime64[ms]")
+    assert sum(len(chunk.duplicates) for chunk in chunks) == duplicates == 1
+
+
 def test_load_recording_combines_rr_and_events(tmp_path):
     for filename in ("sample_RR_0001TEST.csv", "sample_Events_0001TEST.csv"):
         (tmp_path / filename).write_text(
@@ -48,3 +112,33 @@ def test_load_recording_combines_rr_and_events(tmp_path):
     assert len(recording.events) == 2
     assert duplicates == 0  # No duplicates in test fixture
     assert len(duplicate_details) == 0  # No duplicate details
+
+
+def test_recording_exposes_rr_columns_as_arrays(tmp_path):
+    for filename in ("sample_RR_0001TEST.csv", "sample_Events_0001TEST.csv"):
+        (tmp_path / filename).write_text(
+            (FIXTURES / filename).read_text(encoding="utf-8"), encoding="utf-8"
+        )
+
+    recording, _, _ = load_recording(discover_recordings(tmp_path)[0])
+
+    assert recording.rr_ms_arr.dtype == np.int16
+    assert recording.rr_ms_arr.tolist() == [rr.rr_ms for rr in recording.rr_intervals]
+    assert recording.elapsed_ms_arr.tolist() == [rr.elapsed_ms for rr in recording.rr_intervals]
+    assert not recording.elapsed_ms_missing.any()
+    assert recording.timestamps_arr[0] == np.datetime64("2025-03-20T09:00:08", "ms")
+
+
+def test_load_recordings_from_directory_parallel_matches_serial(tmp_path):
+    for participant in ("0001TEST", "0002TEST"):
+        for kind in ("RR", "Events"):
+            (tmp_path / f"sample_{kind}_{participant}.csv").write_text(
+                (FIXTURES / f"sample_{kind}_0001TEST.csv").read_text(encoding="utf-8"),
+                encoding="utf-8",
+            )
+
+    serial = load_recordings_from_directory(tmp_path)  # Serial by default
+    parallel = load_recordings_from_directory(tmp_path, workers=2)
+
+    assert [rec.participant_id for rec, _, _ in parallel] == ["0001TEST", "0002TEST"]
+    assert parallel == serial
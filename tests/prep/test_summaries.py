@@ -25,3 +25,17 @@ def test_load_hrv_logger_preview_returns_summary(tmp_path):
     assert summary.artifact_ratio > 0
     assert summary.events
     assert any(status.canonical for status in summary.events)
+
+
+def test_table_row_is_formatted_once(tmp_path):
+    for filename in ("sample_RR_0001TEST.csv", "sample_Events_0001TEST.csv"):
+        (tmp_path / filename).write_text(
+            (FIXTURES / filename).read_text(encoding="utf-8"), encoding="utf-8"
+        )
+
+    summary = load_hrv_logger_preview(tmp_path, pattern=r"(?P<participant>\d{4}TEST)")[0]
+
+    row = summary.table_row
+    assert row["Files"] == "1RR/1Ev"
+    assert row["Artifacts (%)"] == f"{summary.artifact_ratio * 100:.1f}"
+    assert summary.table_row is row
@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from rrational.config.sections import SectionDefinition, SectionsConfig
 from rrational.segments import SectionNormalizer
 
 
@@ -48,3 +49,28 @@ def test_sections_config_exposes_groups():
     assert "default" in normalizer.config.groups
     template = normalizer.config.groups["default"]
     assert template.required_sections
+
+
+def _config(*definitions: tuple[str, str]) -> SectionsConfig:
+    return SectionsConfig(
+        version=1,
+        canonical_order=tuple(name for name, _ in definitions),
+        sections={
+            name: SectionDefinition(name, (pattern,), required=False)
+            for name, pattern in definitions
+        },
+        groups={},
+    )
+
+
+def test_earlier_canonical_wins_regardless_of_match_position():
+    normalizer = SectionNormalizer(config=_config(("first", "end"), ("second", "^start")))
+    assert normalizer.normalize("start then end") == "first"
+    assert normalizer.normalize("start") == "second"
+    assert normalizer.normalize("then start") == "unknown"
+
+
+def test_backreference_patterns_still_match():
+    normalizer = SectionNormalizer(config=_config(("first", "end"), ("echo", r"(ab)\1")))
+    assert normalizer.normalize("abab") == "echo"
+    assert normalizer.normalize("ab end") == "first"